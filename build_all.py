@@ -7,12 +7,23 @@ SaveGuard 多平台构建脚本
 """
 
 import os
+import re
 import sys
+import time
+import asyncio
+import logging
 import subprocess
 import platform
+import json
 import shutil
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence
+
+# 增大 shutil 回退复制时的缓冲区，减少大文件复制的系统调用次数
+if hasattr(shutil, "COPY_BUFSIZE"):
+    shutil.COPY_BUFSIZE = 4 * 1024 * 1024 if sys.platform != "win32" else 1024 * 1024
 
 # 设置控制台编码为UTF-8，解决Windows环境下的Unicode编码问题
 def setup_console_encoding():
@@ -24,21 +35,25 @@ def setup_console_encoding():
             os.system("chcp 65001 >nul 2>&1")
             # 设置环境变量
             os.environ['PYTHONIOENCODING'] = 'utf-8'
-            # 设置标准输出编码
-            import codecs
-            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
-            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
+            # 原地切换标准输出编码，不额外包装流
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.reconfigure(encoding='utf-8', errors='replace')
+                except AttributeError:
+                    pass
         except:
             pass
 
+# 非ASCII字符匹配（预编译）
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+def _strip_non_ascii(text: str) -> str:
+    """移除所有非ASCII字符"""
+    return _NON_ASCII_RE.sub('', text)
+
 # 安全打印函数，处理Unicode编码错误
 def safe_print(text: str, fallback: str = None):
     """安全打印函数，处理Unicode编码错误"""
-    def clean_text(text: str) -> str:
-        """移除所有非ASCII字符"""
-        import re
-        return re.sub(r'[^\x00-\x7F]+', '', text)
-    
     try:
         print(text)
     except UnicodeEncodeError:
@@ -48,13 +63,171 @@ def safe_print(text: str, fallback: str = None):
                 print(fallback)
             except UnicodeEncodeError:
                 # 如果fallback也失败，移除所有非ASCII字符
-                print(clean_text(fallback))
+                print(_strip_non_ascii(fallback))
         else:
             # 移除emoji和特殊字符，保留基本文本
-            print(clean_text(text))
+            print(_strip_non_ascii(text))
+
+def _package_satisfied(name: str, minimum: str, exact: bool = False) -> bool:
+    """检查已安装的包版本是否满足最低要求；exact 为 True 时要求版本完全一致（对应 == 固定版本）"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        # Python 3.7 没有 importlib.metadata，交给 pip 处理
+        return False
+    
+    try:
+        installed = version(name)
+    except PackageNotFoundError:
+        return False
+    
+    try:
+        from packaging.version import Version
+        installed_version, required_version = Version(installed), Version(minimum)
+    except ImportError:
+        def as_tuple(v: str) -> Tuple[int, ...]:
+            return tuple(int(part) for part in re.findall(r'\d+', v)[:3])
+        installed_version, required_version = as_tuple(installed), as_tuple(minimum)
+    if exact:
+        return installed_version == required_version
+    return installed_version >= required_version
+
+def _stat_mb(path: Path) -> Optional[float]:
+    """获取文件大小（MB），文件不存在时返回 None（只执行一次 stat）"""
+    try:
+        return os.stat(path).st_size / (1 << 20)
+    except FileNotFoundError:
+        return None
+
+def _fast_copy(src: Path, dst: Path):
+    """复制文件并保留元数据（等同 shutil.copy2），尽量让数据只在内核中复制
+    
+    Windows 使用 CopyFile2，Linux 使用 os.sendfile，其他情况回退到 shutil.copyfile。
+    """
+    if sys.platform == "win32":
+        import ctypes
+        # CopyFile2 返回 HRESULT，负值表示失败
+        if ctypes.windll.kernel32.CopyFile2(str(src), str(dst), None) < 0:
+            shutil.copyfile(src, dst)
+    elif sys.platform.startswith("linux"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(in_fd).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+        except OSError:
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _read_log_tail(log_path: Path, lines: int = 200, max_bytes: int = 1 << 16) -> str:
+    """读取日志文件末尾的若干行，用于错误报告"""
+    with open(log_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - max_bytes, 0))
+        data = f.read()
+    return "".join(data.decode('utf-8', errors='ignore').splitlines(keepends=True)[-lines:])
+
+def _run_logged(args: List[str], log_path: Path, timeout: Optional[float] = None,
+                env: Optional[Dict[str, str]] = None, input: Optional[str] = None) -> None:
+    """运行命令并将输出直接重定向到日志文件，失败时读取日志末尾用于错误报告
+    
+    子进程直接写入日志文件，Python 侧不再读取管道，输出较多时也不会因管道写满而阻塞。
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(log_path, 'wb') as log_file:
+        proc = subprocess.Popen(args, stdout=log_file, stderr=subprocess.STDOUT,
+                                stdin=subprocess.PIPE if input is not None else None, env=env)
+        try:
+            if input is not None:
+                proc.stdin.write(input.encode('utf-8'))
+                proc.stdin.close()
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout, output=_read_log_tail(log_path))
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args, stderr=_read_log_tail(log_path))
+
+async def _run_logged_async(args: List[str], log_path: Path, timeout: Optional[float] = None,
+                            env: Optional[Dict[str, str]] = None, input: Optional[str] = None) -> None:
+    """_run_logged 的异步版本，多个子进程可由同一个事件循环驱动"""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(log_path, 'wb') as log_file:
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=log_file, stderr=asyncio.subprocess.STDOUT,
+            stdin=asyncio.subprocess.PIPE if input is not None else None, env=env)
+        
+        async def communicate():
+            if input is not None:
+                proc.stdin.write(input.encode('utf-8'))
+                await proc.stdin.drain()
+                proc.stdin.close()
+            return await proc.wait()
+        
+        try:
+            returncode = await asyncio.wait_for(communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout, output=_read_log_tail(log_path))
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args, stderr=_read_log_tail(log_path))
+
+def _run_async(coro):
+    """在新的事件循环中运行协程"""
+    if sys.platform == "win32" and sys.version_info < (3, 8):
+        # Python 3.7 在 Windows 上的默认事件循环不支持子进程
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    return asyncio.run(coro)
+
+def _print_utf8(text: str, fallback: str = None):
+    """UTF-8 控制台下直接打印，无需编码回退"""
+    print(text)
+
+# 构建细节日志（命令行、日志路径等），设置 SAVEGUARD_BUILD_VERBOSE=0 可关闭
+VERBOSE = os.environ.get("SAVEGUARD_BUILD_VERBOSE", "1") == "1"
+logger = logging.getLogger("saveguard.build")
+
+class _CommandLine:
+    """延迟拼接的命令行，仅在日志真正输出时才格式化"""
+    __slots__ = ("args",)
+    
+    def __init__(self, args: List[str]):
+        self.args = args
+    
+    def __str__(self):
+        return " ".join(str(arg) for arg in self.args)
+
+def setup_logging():
+    """配置构建日志输出到标准输出"""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO if VERBOSE else logging.WARNING)
+    logger.propagate = False
 
 # 初始化控制台编码
 setup_console_encoding()
+setup_logging()
+
+# 控制台已是UTF-8时跳过异常处理路径
+if (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '') == 'utf8':
+    safe_print = _print_utf8
 
 # 构建矩阵配置
 BUILD_MATRIX = {
@@ -75,6 +248,52 @@ BUILD_MATRIX = {
     }
 }
 
+# 构建输出目录
+DIST_DIR = Path("dist")
+
+# Docker构建镜像
+DOCKER_PYTHON_IMAGE = "python:3.11-slim"
+DOCKER_BASE_IMAGE = "saveguard-builder:base"
+
+# PyInstaller 规格文件（模块排除、隐藏导入和数据文件均在其中配置）
+PYINSTALLER_SPEC = "specs/saveguard.spec"
+
+def build_pyinstaller_args(dist_dir: str, workpath: str, pyinstaller: Sequence[str] = ("pyinstaller",)) -> List[str]:
+    """生成PyInstaller命令行（本机、Docker、WSL 三种构建方式共用）
+    
+    模块排除、隐藏导入和数据文件统一在规格文件中配置，这里只传入不同构建方式之间有差异的目录参数。
+    不传 --clean，重复构建时复用 workpath 中的分析缓存；需要全新构建时使用 --fresh 删除 workpath。
+    """
+    return [
+        *pyinstaller,
+        "--noconfirm",
+        "--distpath", dist_dir,
+        "--workpath", workpath,
+        PYINSTALLER_SPEC,
+    ]
+
+# 参与构建缓存键计算的输入（源码、规格文件和依赖）
+BUILD_INPUTS = ("run.py", "requirements.txt", "src", "specs")
+# 构建缓存键存放目录，与可执行文件放在一起
+BUILD_CACHE_DIR = DIST_DIR / ".cache"
+# 各配置上次构建耗时（秒），用于安排构建顺序
+BUILD_TIMES_FILE = BUILD_CACHE_DIR / "build_times.json"
+
+def _hash_file(digest, path: Path):
+    """以 1 MiB 分块将文件内容写入哈希对象"""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+# WSL 中执行的构建脚本
+WSL_BUILD_SCRIPT = "scripts/wsl_build.py"
+
+def _to_wsl_path(path: Path) -> str:
+    """将 Windows 路径转换为 WSL 挂载路径，如 C:\\code -> /mnt/c/code"""
+    drive, rest = os.path.splitdrive(str(path))
+    drive = drive.rstrip(':').lower()
+    return f"/mnt/{drive}{rest.replace(os.sep, '/')}"
+
 class BuildConfig:
     """构建配置类"""
     def __init__(self, platform_name: str, arch: str, config: Dict):
@@ -83,15 +302,28 @@ class BuildConfig:
         self.ext = config["ext"]
         self.python_arch = config["python_arch"]
         self.name = f"SaveGuard-{platform_name.title()}-{arch}{self.ext}"
+        self.output_path = DIST_DIR / self.name
+        self.work_path = Path("build") / f"{platform_name}-{arch}"
+        self.hash_path = BUILD_CACHE_DIR / f"{self.name}.hash"
         
     def __str__(self):
         return f"{self.platform}-{self.arch}"
 
+# 预先展开构建矩阵并创建所有构建配置，查询时只需顺序过滤
+_ALL_BUILD_CONFIGS: Tuple[BuildConfig, ...] = tuple(
+    BuildConfig(platform_name, arch, config)
+    for platform_name, arch_map in BUILD_MATRIX.items()
+    for arch, config in arch_map.items()
+)
+
 class MultiPlatformBuilder:
     """多平台构建器"""
     
     def __init__(self):
         system_name = platform.system().lower()
+        # 缓存系统信息，输出横幅和说明文件时不再重复查询
+        self._sys_info = f"{platform.system()} {platform.release()}"
+        self._py_version = sys.version
         # 标准化平台名称
         if system_name == "darwin":
             self.current_platform = "macos"
@@ -99,8 +331,24 @@ class MultiPlatformBuilder:
             self.current_platform = system_name
         self.current_arch = self._get_current_arch()
         self.build_results = []
-        self.dist_dir = Path("dist")
+        self.dist_dir = DIST_DIR
         self.release_dir = Path("release")
+        # 预先解析绝对路径，避免每个配置重复调用 getcwd
+        self._cwd = Path.cwd()
+        self._dist_abs = self._cwd / self.dist_dir
+        # 探测结果缓存，避免每个配置重复启动子进程
+        self._docker_available: Optional[bool] = None
+        self._docker_daemon_ok: Optional[bool] = None
+        self._wsl_available: Optional[bool] = None
+        self._dependencies_ok: Optional[bool] = None
+        self._docker_image_ready: Optional[bool] = None  # 基础镜像构建结果，失败也缓存，之后的配置不再重复构建
+        self._docker_image_task = None  # 正在进行的基础镜像构建 (事件循环, Task)，并发的配置共同等待
+        self._icon_cache: Dict[str, Optional[str]] = {}
+        self._config_cache: Dict[Tuple, List[BuildConfig]] = {}
+        self._asset_files = self._scan_assets()
+        self._sources_digest = None
+        self._input_hashes: Dict[str, str] = {}
+        self.build_times: Dict[str, float] = {}
         
     def _get_current_arch(self) -> str:
         """获取当前架构"""
@@ -113,8 +361,27 @@ class MultiPlatformBuilder:
             return "aarch64" if machine == "aarch64" else "x86_64"
         return "unknown"
     
+    def _scan_assets(self) -> set:
+        """一次性扫描资源目录，返回文件相对路径集合"""
+        asset_files = set()
+        for directory in ("assets", "assets/icons"):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            asset_files.add(f"{directory}/{entry.name}")
+            except OSError:
+                continue
+        return asset_files
+    
     def _get_icon_path(self, platform_name: str) -> Optional[str]:
         """获取平台对应的图标路径"""
+        if platform_name not in self._icon_cache:
+            self._icon_cache[platform_name] = self._find_icon_path(platform_name)
+        return self._icon_cache[platform_name]
+    
+    def _find_icon_path(self, platform_name: str) -> Optional[str]:
+        """查找平台对应的图标文件"""
         icon_paths = {
             "windows": "assets/icon.ico",
             "macos": "assets/icon.icns", 
@@ -122,7 +389,7 @@ class MultiPlatformBuilder:
         }
         
         icon_path = icon_paths.get(platform_name)
-        if icon_path and os.path.exists(icon_path):
+        if icon_path and icon_path in self._asset_files:
             return icon_path
         
         # 如果首选图标不存在，尝试备用图标
@@ -133,7 +400,7 @@ class MultiPlatformBuilder:
         }
         
         for fallback in fallback_paths.get(platform_name, []):
-            if os.path.exists(fallback):
+            if fallback in self._asset_files:
                 return fallback
         
         return None
@@ -142,13 +409,19 @@ class MultiPlatformBuilder:
         """检查Python版本"""
         if sys.version_info < (3, 7):
             safe_print("❌ 需要Python 3.7或更高版本", "[ERROR] Python 3.7 or higher required")
-            safe_print(f"当前版本: {sys.version}", f"Current version: {sys.version}")
+            safe_print(f"当前版本: {self._py_version}", f"Current version: {self._py_version}")
             return False
-        safe_print(f"✅ Python版本检查通过: {sys.version}", f"[OK] Python version check passed: {sys.version}")
+        safe_print(f"✅ Python版本检查通过: {self._py_version}", f"[OK] Python version check passed: {self._py_version}")
         return True
     
     def check_dependencies(self) -> bool:
-        """检查构建依赖"""
+        """检查构建依赖（结果在构建器生命周期内缓存）"""
+        if self._dependencies_ok is None:
+            self._dependencies_ok = self._check_dependencies()
+        return self._dependencies_ok
+    
+    def _check_dependencies(self) -> bool:
+        """执行构建依赖检查"""
         safe_print("\n📦 检查构建依赖...", "\n[INFO] Checking build dependencies...")
         
         # 检查必要文件
@@ -177,55 +450,82 @@ class MultiPlatformBuilder:
             safe_print("发现 macOS 依赖安装脚本，建议先运行:", "[INFO] Found macOS dependency installer, recommend running:")
             safe_print("python install_macos_deps.py", "python install_macos_deps.py")
         
+        # 并行执行两个互不依赖的 Homebrew 探测，同时检查已安装的包
+        executor = ThreadPoolExecutor(max_workers=2)
+        brew_future = executor.submit(subprocess.run, ["brew", "--version"], 
+                                      capture_output=True, text=True, timeout=10)
+        qt_future = executor.submit(subprocess.run, ["brew", "--prefix", "qt@5"], 
+                                    capture_output=True, text=True, timeout=10)
+        executor.shutdown(wait=False)
+        
+        # 已满足版本要求的包无需再次安装
+        packages = []
+        if _package_satisfied("pyinstaller", "5.13.0"):
+            safe_print("✅ PyInstaller 已满足版本要求", "[OK] PyInstaller already satisfied")
+        else:
+            packages.append("pyinstaller>=5.13.0")
+        # 与安装时的 PyQt5==5.15.10 保持一致，只接受完全相同的版本
+        if _package_satisfied("PyQt5", "5.15.10", exact=True):
+            safe_print("✅ PyQt5 已满足版本要求", "[OK] PyQt5 already satisfied")
+        else:
+            packages.append("PyQt5==5.15.10")
+        
         # 检查 Homebrew
         try:
-            result = subprocess.run(["brew", "--version"], 
-                                  capture_output=True, text=True, timeout=10)
+            result = brew_future.result()
             if result.returncode != 0:
                 safe_print("⚠️ 未找到 Homebrew，PyQt5 安装可能失败", "[WARNING] Homebrew not found, PyQt5 installation may fail")
         except:
             safe_print("⚠️ 无法检查 Homebrew 状态", "[WARNING] Cannot check Homebrew status")
         
+        if not packages:
+            return True
+        
         # 尝试安装依赖
         try:
             safe_print("安装 macOS 依赖...", "Installing macOS dependencies...")
+            env = os.environ.copy()
             
-            # 设置 Qt5 环境变量
-            qt_result = subprocess.run(["brew", "--prefix", "qt@5"], 
-                                     capture_output=True, text=True, timeout=10)
-            if qt_result.returncode == 0:
-                qt_dir = qt_result.stdout.strip()
-                env = os.environ.copy()
-                env.update({
-                    'QT_DIR': qt_dir,
-                    'PATH': f"{qt_dir}/bin:{env.get('PATH', '')}",
-                    'PKG_CONFIG_PATH': f"{qt_dir}/lib/pkgconfig:{env.get('PKG_CONFIG_PATH', '')}",
-                    'LDFLAGS': f"-L{qt_dir}/lib",
-                    'CPPFLAGS': f"-I{qt_dir}/include"
-                })
-            else:
-                env = os.environ.copy()
+            # 设置 Qt5 环境变量（仅在需要安装 PyQt5 时）
+            if "PyQt5==5.15.10" in packages:
+                try:
+                    qt_result = qt_future.result()
+                except (subprocess.TimeoutExpired, OSError):
+                    qt_result = None
+                if qt_result and qt_result.returncode == 0:
+                    qt_dir = qt_result.stdout.strip()
+                    env.update({
+                        'QT_DIR': qt_dir,
+                        'PATH': f"{qt_dir}/bin:{env.get('PATH', '')}",
+                        'PKG_CONFIG_PATH': f"{qt_dir}/lib/pkgconfig:{env.get('PKG_CONFIG_PATH', '')}",
+                        'LDFLAGS': f"-L{qt_dir}/lib",
+                        'CPPFLAGS': f"-I{qt_dir}/include"
+                    })
             
-            # 安装 PyInstaller
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", "pyinstaller>=5.13.0"
-            ], check=True, capture_output=True, text=True, encoding='utf-8', env=env)
-            safe_print("✅ PyInstaller安装完成", "[OK] PyInstaller installation completed")
-            
-            # 尝试安装 PyQt5
-            safe_print("安装 PyQt5...", "Installing PyQt5...")
-            pyqt_result = subprocess.run([
+            # 一次性安装缺失的依赖，只启动一次 pip 解析
+            safe_print(f"安装 {' '.join(packages)}...", f"Installing {' '.join(packages)}...")
+            pip_result = subprocess.run([
                 sys.executable, "-m", "pip", "install", 
-                "PyQt5==5.15.10", "--no-cache-dir"
+                *packages, "--no-cache-dir"
             ], capture_output=True, text=True, encoding='utf-8', 
             env=env, timeout=300)
             
-            if pyqt_result.returncode == 0:
-                safe_print("✅ PyQt5安装完成", "[OK] PyQt5 installation completed")
+            if pip_result.returncode == 0:
+                safe_print(f"✅ 依赖安装完成: {', '.join(packages)}", f"[OK] Dependencies installed: {', '.join(packages)}")
+            elif "PyQt5==5.15.10" not in packages:
+                # 只有 PyInstaller 需要安装时失败即终止
+                pip_result.check_returncode()
             else:
                 safe_print("⚠️ PyQt5安装失败，但继续构建", "[WARNING] PyQt5 installation failed, but continuing build")
-                if pyqt_result.stderr:
-                    safe_print(f"PyQt5错误: {pyqt_result.stderr[:200]}...", f"PyQt5 error: {pyqt_result.stderr[:200]}...")
+                if pip_result.stderr:
+                    safe_print(f"PyQt5错误: {pip_result.stderr[:200]}...", f"PyQt5 error: {pip_result.stderr[:200]}...")
+                
+                # 批量安装失败时单独安装 PyInstaller，PyQt5 失败不影响构建
+                if "pyinstaller>=5.13.0" in packages:
+                    subprocess.run([
+                        sys.executable, "-m", "pip", "install", "pyinstaller>=5.13.0"
+                    ], check=True, capture_output=True, text=True, encoding='utf-8', env=env)
+                    safe_print("✅ PyInstaller安装完成", "[OK] PyInstaller installation completed")
             
             return True
             
@@ -243,6 +543,10 @@ class MultiPlatformBuilder:
     
     def _check_standard_dependencies(self) -> bool:
         """检查标准依赖"""
+        if _package_satisfied("pyinstaller", "5.13.0"):
+            safe_print("✅ PyInstaller 已满足版本要求", "[OK] PyInstaller already satisfied")
+            return True
+        
         try:
             safe_print("安装PyInstaller...", "Installing PyInstaller...")
             result = subprocess.run([
@@ -259,21 +563,17 @@ class MultiPlatformBuilder:
             safe_print(f"❌ 安装过程异常: {e}", f"[ERROR] Installation exception: {e}")
             return False
     
-    def get_build_configs(self, platforms: Optional[List[str]] = None) -> List[BuildConfig]:
+    def get_build_configs(self, platforms: Optional[Sequence[str]] = None) -> List[BuildConfig]:
         """获取构建配置列表"""
-        if platforms is None:
-            platforms = list(BUILD_MATRIX.keys())
-        
-        configs = []
-        for platform_name in platforms:
-            if platform_name not in BUILD_MATRIX:
+        key = ("all", tuple(platforms) if platforms is not None else None)
+        if key not in self._config_cache:
+            platforms_set = frozenset(platforms if platforms is not None else BUILD_MATRIX)
+            for platform_name in platforms_set - BUILD_MATRIX.keys():
                 safe_print(f"⚠️ 不支持的平台: {platform_name}", f"[WARNING] Unsupported platform: {platform_name}")
-                continue
-                
-            for arch, config in BUILD_MATRIX[platform_name].items():
-                configs.append(BuildConfig(platform_name, arch, config))
+            
+            self._config_cache[key] = [c for c in _ALL_BUILD_CONFIGS if c.platform in platforms_set]
         
-        return configs
+        return list(self._config_cache[key])
     
     def can_build_cross_platform(self, target_platform: str) -> bool:
         """检查是否可以交叉编译到目标平台"""
@@ -301,169 +601,85 @@ class MultiPlatformBuilder:
         
         return False
     
-    def get_buildable_configs(self, platforms: Optional[List[str]] = None) -> List[BuildConfig]:
+    def get_buildable_configs(self, platforms: Optional[Sequence[str]] = None) -> List[BuildConfig]:
         """获取可构建的配置列表（智能模式）"""
-        if platforms is None:
-            platforms = list(BUILD_MATRIX.keys())
-        
-        configs = []
-        for platform_name in platforms:
-            if platform_name not in BUILD_MATRIX:
-                continue
-                
-            for arch, config in BUILD_MATRIX[platform_name].items():
-                build_config = BuildConfig(platform_name, arch, config)
-                
-                # 检查是否可以构建
-                if self.can_build_cross_platform(platform_name):
+        key = ("buildable", tuple(platforms) if platforms is not None else None)
+        if key not in self._config_cache:
+            platforms_set = frozenset(platforms if platforms is not None else BUILD_MATRIX)
+            
+            # 检查是否可以构建（同一平台只检查一次）
+            buildable = {p for p in platforms_set & BUILD_MATRIX.keys() if self.can_build_cross_platform(p)}
+            
+            configs = []
+            for build_config in _ALL_BUILD_CONFIGS:
+                if build_config.platform in buildable:
                     configs.append(build_config)
-                else:
-                    safe_print(f"⚠️ 跳过 {platform_name}-{arch} (无法在当前平台构建)", f"[SKIP] {platform_name}-{arch} (cannot build on current platform)")
+                elif build_config.platform in platforms_set:
+                    safe_print(f"⚠️ 跳过 {build_config} (无法在当前平台构建)", f"[SKIP] {build_config} (cannot build on current platform)")
+            
+            self._config_cache[key] = configs
         
-        return configs
+        return list(self._config_cache[key])
     
     def _check_docker_available(self) -> bool:
         """检查Docker是否可用"""
-        try:
-            result = subprocess.run(["docker", "--version"], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        if self._docker_available is None:
+            # 仅查找可执行文件，不启动子进程
+            self._docker_available = shutil.which("docker") is not None
+        return self._docker_available
+    
+    def _verify_docker_daemon(self) -> bool:
+        """检查Docker服务是否正在运行（仅在实际使用Docker构建时调用）"""
+        if self._docker_daemon_ok is None:
+            try:
+                result = subprocess.run(["docker", "info"], 
+                                      capture_output=True, text=True, timeout=5)
+                self._docker_daemon_ok = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                self._docker_daemon_ok = False
+        return self._docker_daemon_ok
     
     def _check_wsl_available(self) -> bool:
         """检查WSL是否可用（Windows上）"""
-        try:
-            result = subprocess.run(["wsl", "--status"], 
-                                  capture_output=True, text=True, encoding='utf-8', errors='ignore', timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, UnicodeDecodeError):
-            return False
+        if self._wsl_available is None:
+            self._wsl_available = shutil.which("wsl") is not None
+        return self._wsl_available
     
     def build_single_platform(self, config: BuildConfig, force: bool = False) -> bool:
         """构建单个平台"""
         safe_print(f"\n🔨 构建 {config.platform}-{config.arch}...", f"\n[BUILD] Building {config.platform}-{config.arch}...")
         
         # 检查是否已存在
-        output_file = self.dist_dir / config.name
-        if output_file.exists() and not force:
-            size_mb = output_file.stat().st_size / (1024 * 1024)
-            safe_print(f"⏭️ 跳过 {config.name} (已存在, {size_mb:.1f} MB)", f"[SKIP] {config.name} (already exists, {size_mb:.1f} MB)")
-            self.build_results.append({
-                "config": config,
-                "file": output_file,
-                "size_mb": size_mb,
-                "success": True,
-                "skipped": True
-            })
+        if self._skip_existing(config, force):
             return True
+        output_file = config.output_path
         
-        # 检查是否可以构建
-        if not self.can_build_cross_platform(config.platform):
-            safe_print(f"⚠️ 无法在 {self.current_platform} 上构建 {config.platform} 版本", f"[WARNING] Cannot build {config.platform} version on {self.current_platform}")
-            return False
-        
-        # 尝试使用Docker构建
-        if config.platform != self.current_platform and self._check_docker_available():
-            safe_print(f"🐳 尝试使用Docker构建 {config.platform}-{config.arch}...", f"[DOCKER] Trying to build {config.platform}-{config.arch} with Docker...")
-            if self._build_with_docker(config, force):
-                return True
-            else:
-                safe_print(f"⚠️ Docker构建失败，尝试其他方法...", "[WARNING] Docker build failed, trying other methods...")
-        
-        # 尝试使用WSL构建（Windows上构建Linux）
-        if (self.current_platform == "windows" and config.platform == "linux" and 
-            self._check_wsl_available()):
-            safe_print(f"🐧 尝试使用WSL构建 {config.platform}-{config.arch}...", f"[WSL] Trying to build {config.platform}-{config.arch} with WSL...")
-            if self._build_with_wsl(config, force):
-                return True
-            else:
-                safe_print(f"⚠️ WSL构建失败，尝试其他方法...", "[WARNING] WSL build failed, trying other methods...")
-        
-        # 如果无法交叉编译，提供友好的错误信息
+        # 本平台直接构建；只有需要交叉编译时才探测Docker/WSL
         if config.platform != self.current_platform:
-            safe_print(f"❌ 无法在 {self.current_platform} 上构建 {config.platform} 版本", f"[ERROR] Cannot build {config.platform} version on {self.current_platform}")
-            safe_print(f"💡 建议:", "[SUGGESTION] Recommendations:")
-            safe_print(f"   - 在 {config.platform} 系统上直接运行此脚本", f"   - Run this script directly on {config.platform} system")
-            safe_print(f"   - 使用Docker Desktop并确保Docker服务正在运行", "   - Use Docker Desktop and ensure Docker service is running")
-            safe_print(f"   - 使用虚拟机运行目标平台", "   - Use virtual machine to run target platform")
-            return False
+            return self._build_cross_platform(config, force)
         
-        # 构建参数
-        args = [
-            "pyinstaller",
-            "--onefile",
-            "--noconfirm",
-            "--clean",
-            "--noconsole",
-            "--name", config.name,
-            "--distpath", str(self.dist_dir),
-            "--workpath", "build",
-            "--specpath", "specs",
-        ]
-        
-        # 添加数据文件
-        if os.path.exists("src/languages"):
-            languages_path = os.path.abspath("src/languages")
-            args.extend(["--add-data", f"{languages_path}{os.pathsep}languages"])
-        
-        if os.path.exists("src"):
-            src_path = os.path.abspath("src")
-            args.extend(["--add-data", f"{src_path}{os.pathsep}src"])
-        
-        # 排除不必要的模块
-        exclude_modules = [
-            "tkinter", "matplotlib", "numpy", "pandas", "scipy",
-            "PIL", "cv2", "tensorflow", "torch", "jupyter",
-            "notebook", "IPython", "unittest", "test", "tests"
-        ]
-        
-        for module in exclude_modules:
-            args.extend(["--exclude-module", module])
-        
-        # 隐藏导入
-        hidden_imports = [
-            "PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets",
-            "psutil", "pynput", "pygame", "json", "os", "sys",
-            "time", "threading", "pathlib", "datetime", "signal", "typing"
-        ]
-        
-        # 平台特定隐藏导入
-        if config.platform == "windows":
-            hidden_imports.extend([
-                "winsound", "win32gui", "win32process", "win32api", "win32con"
-            ])
-        elif config.platform == "macos":
-            hidden_imports.extend([
-                "AppKit", "Foundation", "Quartz", "Cocoa"
-            ])
-        elif config.platform == "linux":
-            hidden_imports.extend([
-                "Xlib", "Xlib.display", "Xlib.X", "Xlib.XK", "Xlib.Xutil"
-            ])
-        
-        for module in hidden_imports:
-            args.extend(["--hidden-import", module])
-        
-        # 添加图标配置
-        icon_path = self._get_icon_path(config.platform)
-        if icon_path and os.path.exists(icon_path):
-            # 使用绝对路径避免PyInstaller路径解析问题
-            abs_icon_path = os.path.abspath(icon_path)
-            args.extend(["--icon", abs_icon_path])
+        # 构建参数（每个配置使用独立的临时目录，避免并行构建互相覆盖）
+        args = build_pyinstaller_args(str(self.dist_dir), str(config.work_path))
         
-        # 添加主程序
-        args.append("run.py")
+        # 通过环境变量向规格文件传递目标名称、平台和图标
+        env = os.environ.copy()
+        env.update(self._spec_env(config))
+        # 每个配置使用独立的PyInstaller缓存目录，避免并行构建同时写入同一缓存；目录固定，多次构建间复用 bincache
+        env["PYINSTALLER_CONFIG_DIR"] = str((Path("build") / "pyi-config" / str(config)).resolve())
+        # 子进程中的Python及时刷新输出，日志文件可实时查看
+        env["PYTHONUNBUFFERED"] = "1"
         
-        safe_print(f"执行命令: {' '.join(args)}", f"Executing command: {' '.join(args)}")
+        logger.info("执行命令: %s", _CommandLine(args))
         
         try:
             # 执行构建
-            result = subprocess.run(args, check=True, capture_output=True, text=True)
+            log_path = Path("build") / "logs" / f"{config}.log"
+            logger.info("构建日志: %s", log_path)
+            _run_logged(args, log_path, env=env)
             
             # 检查生成的文件
-            if output_file.exists():
-                size_mb = output_file.stat().st_size / (1024 * 1024)
+            size_mb = _stat_mb(output_file)
+            if size_mb is not None:
                 safe_print(f"✅ 构建成功: {config.name} ({size_mb:.1f} MB)", f"[SUCCESS] Build successful: {config.name} ({size_mb:.1f} MB)")
                 self.build_results.append({
                     "config": config,
@@ -471,6 +687,7 @@ class MultiPlatformBuilder:
                     "size_mb": size_mb,
                     "success": True
                 })
+                self._save_inputs_hash(config)
                 return True
             else:
                 safe_print(f"❌ 未找到生成文件: {config.name}", f"[ERROR] Generated file not found: {config.name}")
@@ -486,12 +703,14 @@ class MultiPlatformBuilder:
             safe_print(f"❌ 构建失败: {e}", f"[ERROR] Build failed: {e}")
             if e.stderr:
                 safe_print(f"错误详情: {e.stderr}", f"Error details: {e.stderr}")
+            # 使用日志最后一行作为错误摘要
+            tail_lines = e.stderr.strip().splitlines() if e.stderr else []
             self.build_results.append({
                 "config": config,
                 "file": None,
                 "size_mb": 0,
                 "success": False,
-                "error": str(e)
+                "error": tail_lines[-1] if tail_lines else str(e)
             })
             return False
         except Exception as e:
@@ -505,53 +724,169 @@ class MultiPlatformBuilder:
             })
             return False
     
+    def _inputs_hash(self, config: BuildConfig) -> str:
+        """计算构建输入的哈希值：源码、规格文件、依赖、图标、构建配置和PyInstaller参数"""
+        cached = self._input_hashes.get(config.name)
+        if cached is not None:
+            return cached
+        
+        # 源码部分对所有配置相同，只遍历一次
+        if self._sources_digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for entry in BUILD_INPUTS:
+                path = self._cwd / entry
+                if path.is_dir():
+                    files = []
+                    for root, dirs, names in os.walk(path):
+                        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                        files.extend(Path(root) / name for name in sorted(names))
+                elif path.is_file():
+                    files = [path]
+                else:
+                    continue
+                for file in files:
+                    digest.update(file.relative_to(self._cwd).as_posix().encode('utf-8') + b"\0")
+                    _hash_file(digest, file)
+            self._sources_digest = digest
+        
+        digest = self._sources_digest.copy()
+        icon_path = self._get_icon_path(config.platform)
+        if icon_path:
+            digest.update(icon_path.encode('utf-8') + b"\0")
+            _hash_file(digest, self._cwd / icon_path)
+        digest.update(json.dumps({k: str(v) for k, v in config.__dict__.items()}, sort_keys=True).encode('utf-8'))
+        digest.update(str(_CommandLine(build_pyinstaller_args(str(DIST_DIR), str(config.work_path)))).encode('utf-8'))
+        
+        value = digest.hexdigest()
+        self._input_hashes[config.name] = value
+        return value
+    
+    def _save_inputs_hash(self, config: BuildConfig):
+        """构建成功后记录构建输入的哈希值，下次输入未变化时跳过构建"""
+        try:
+            config.hash_path.parent.mkdir(parents=True, exist_ok=True)
+            config.hash_path.write_text(self._inputs_hash(config), encoding='utf-8')
+        except OSError as e:
+            logger.warning("无法写入构建缓存 %s: %s", config.hash_path, e)
+    
+    def _skip_existing(self, config: BuildConfig, force: bool = False) -> bool:
+        """输出文件已存在、构建输入未变化且未强制重建时记录跳过结果"""
+        size_mb = None if force else _stat_mb(config.output_path)
+        if size_mb is None:
+            return False
+        try:
+            if config.hash_path.read_text(encoding='utf-8').strip() != self._inputs_hash(config):
+                return False
+        except OSError:
+            return False
+        
+        safe_print(f"⏭️ 跳过 {config.name} (输入未变化, {size_mb:.1f} MB)", f"[SKIP] {config.name} (inputs unchanged, {size_mb:.1f} MB)")
+        self.build_results.append({
+            "config": config,
+            "file": config.output_path,
+            "size_mb": size_mb,
+            "success": True,
+            "skipped": True
+        })
+        return True
+    
+    async def build_cross_platforms_async(self, configs: List[BuildConfig], force: bool = False) -> int:
+        """在同一个事件循环中并发执行所有交叉构建，返回成功数量"""
+        async def build_one(config: BuildConfig) -> bool:
+            safe_print(f"\n🔨 构建 {config.platform}-{config.arch}...", f"\n[BUILD] Building {config.platform}-{config.arch}...")
+            if self._skip_existing(config, force):
+                return True
+            start = time.perf_counter()
+            success = await self._build_cross_platform_async(config, force)
+            if success:
+                self.build_times[config.name] = time.perf_counter() - start
+            return success
+        
+        results = await asyncio.gather(*(build_one(config) for config in configs))
+        return sum(1 for success in results if success)
+    
+    def _build_cross_platform(self, config: BuildConfig, force: bool = False) -> bool:
+        """通过Docker或WSL交叉构建其他平台"""
+        return _run_async(self._build_cross_platform_async(config, force))
+    
+    async def _build_cross_platform_async(self, config: BuildConfig, force: bool = False) -> bool:
+        """通过Docker或WSL交叉构建其他平台（异步）"""
+        # 尝试使用Docker构建
+        if self._check_docker_available():
+            safe_print(f"🐳 尝试使用Docker构建 {config.platform}-{config.arch}...", f"[DOCKER] Trying to build {config.platform}-{config.arch} with Docker...")
+            if await self._build_with_docker_async(config, force):
+                return True
+            else:
+                safe_print(f"⚠️ Docker构建失败，尝试其他方法...", "[WARNING] Docker build failed, trying other methods...")
+        
+        # 尝试使用WSL构建（Windows上构建Linux）
+        if (self.current_platform == "windows" and config.platform == "linux" and 
+            self._check_wsl_available()):
+            safe_print(f"🐧 尝试使用WSL构建 {config.platform}-{config.arch}...", f"[WSL] Trying to build {config.platform}-{config.arch} with WSL...")
+            if await self._build_with_wsl_async(config, force):
+                return True
+            else:
+                safe_print(f"⚠️ WSL构建失败，尝试其他方法...", "[WARNING] WSL build failed, trying other methods...")
+        
+        # 无法交叉编译，提供友好的错误信息
+        safe_print(f"❌ 无法在 {self.current_platform} 上构建 {config.platform} 版本", f"[ERROR] Cannot build {config.platform} version on {self.current_platform}")
+        safe_print(f"💡 建议:", "[SUGGESTION] Recommendations:")
+        safe_print(f"   - 在 {config.platform} 系统上直接运行此脚本", f"   - Run this script directly on {config.platform} system")
+        safe_print(f"   - 使用Docker Desktop并确保Docker服务正在运行", "   - Use Docker Desktop and ensure Docker service is running")
+        safe_print(f"   - 使用虚拟机运行目标平台", "   - Use virtual machine to run target platform")
+        return False
+    
+    def _spec_env(self, config: BuildConfig, include_icon: bool = True) -> Dict[str, str]:
+        """生成传递给PyInstaller规格文件的环境变量"""
+        env = {
+            "SAVEGUARD_BUILD_NAME": config.name,
+            "SAVEGUARD_BUILD_PLATFORM": config.platform,
+        }
+        
+        # 添加图标配置（使用绝对路径避免PyInstaller路径解析问题）
+        icon_path = self._get_icon_path(config.platform) if include_icon else None
+        if icon_path:
+            env["SAVEGUARD_BUILD_ICON"] = str(self._cwd / icon_path)
+        return env
+    
     def _build_with_docker(self, config: BuildConfig, force: bool = False) -> bool:
         """使用Docker构建"""
+        return _run_async(self._build_with_docker_async(config, force))
+    
+    async def _build_with_docker_async(self, config: BuildConfig, force: bool = False) -> bool:
+        """使用Docker构建（异步）"""
         safe_print(f"🐳 使用Docker构建 {config.platform}-{config.arch}...", f"[DOCKER] Building {config.platform}-{config.arch} with Docker...")
         
         # 检查Docker是否可用
-        if not self._check_docker_available():
+        if not self._check_docker_available() or not self._verify_docker_daemon():
             safe_print("❌ Docker不可用，跳过Docker构建", "[ERROR] Docker not available, skipping Docker build")
             return False
         
-        # 创建Dockerfile
-        dockerfile_content = self._generate_dockerfile(config)
-        dockerfile_path = Path("Dockerfile.build")
+        # 确保基础镜像已构建（整个构建过程只构建一次）
+        if not await self._ensure_docker_base_image_async():
+            return False
         
         try:
-            with open(dockerfile_path, 'w', encoding='utf-8') as f:
-                f.write(dockerfile_content)
-            
-            # 构建Docker镜像
-            image_name = f"saveguard-builder-{config.platform}-{config.arch}"
-            build_cmd = [
-                "docker", "build", 
-                "-f", str(dockerfile_path),
-                "-t", image_name,
-                "--no-cache",  # 避免缓存问题
-                "."
-            ]
-            
-            safe_print(f"执行Docker构建: {' '.join(build_cmd)}", f"Executing Docker build: {' '.join(build_cmd)}")
-            result = subprocess.run(build_cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', timeout=300)
-            
-            # 运行Docker容器并复制文件
+            # 运行Docker容器，在容器内执行PyInstaller
             container_name = f"saveguard-build-{config.platform}-{config.arch}"
             run_cmd = [
                 "docker", "run", 
                 "--name", container_name,
-                "-v", f"{Path.cwd()}/dist:/output",
+                "-v", f"{self._dist_abs}:/output",
                 "--rm",  # 自动清理容器
-                image_name
             ]
+            for key, value in self._spec_env(config, include_icon=False).items():
+                run_cmd.extend(["-e", f"{key}={value}"])
+            run_cmd.append(DOCKER_BASE_IMAGE)
+            run_cmd.extend(build_pyinstaller_args("/output", "build"))
             
-            safe_print(f"运行Docker容器: {' '.join(run_cmd)}", f"Running Docker container: {' '.join(run_cmd)}")
-            result = subprocess.run(run_cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', timeout=180)
+            logger.info("运行Docker容器: %s", _CommandLine(run_cmd))
+            await _run_logged_async(run_cmd, Path("build") / "logs" / f"{config}-docker-run.log", timeout=300)
             
             # 检查输出文件
-            output_file = self.dist_dir / config.name
-            if output_file.exists():
-                size_mb = output_file.stat().st_size / (1024 * 1024)
+            output_file = config.output_path
+            size_mb = _stat_mb(output_file)
+            if size_mb is not None:
                 safe_print(f"✅ Docker构建成功: {config.name} ({size_mb:.1f} MB)", f"[SUCCESS] Docker build successful: {config.name} ({size_mb:.1f} MB)")
                 self.build_results.append({
                     "config": config,
@@ -559,6 +894,7 @@ class MultiPlatformBuilder:
                     "size_mb": size_mb,
                     "success": True
                 })
+                self._save_inputs_hash(config)
                 return True
             else:
                 safe_print(f"❌ Docker构建失败: 未找到输出文件 {config.name}", f"[ERROR] Docker build failed: output file not found {config.name}")
@@ -575,78 +911,78 @@ class MultiPlatformBuilder:
         except Exception as e:
             safe_print(f"❌ Docker构建异常: {e}", f"[ERROR] Docker build exception: {e}")
             return False
-        finally:
-            # 清理Dockerfile
-            if dockerfile_path.exists():
-                dockerfile_path.unlink()
-            
-            # 清理Docker镜像和容器
-            try:
-                subprocess.run(["docker", "rmi", image_name], capture_output=True, timeout=10)
-            except:
-                pass  # 忽略清理错误
+    
+    def _ensure_docker_base_image(self) -> bool:
+        """构建（或从缓存复用）包含系统依赖和Python依赖的基础镜像"""
+        if self._docker_image_ready is not None:
+            return self._docker_image_ready
+        return _run_async(self._ensure_docker_base_image_async())
+    
+    async def _ensure_docker_base_image_async(self) -> bool:
+        """_ensure_docker_base_image 的异步版本：同一事件循环中的配置共用一个构建任务，等待时不阻塞其他构建"""
+        if self._docker_image_ready is not None:
+            return self._docker_image_ready
+        loop = asyncio.get_event_loop()
+        if self._docker_image_task is None or self._docker_image_task[0] is not loop:
+            self._docker_image_task = (loop, loop.create_task(self._run_docker_base_build_async()))
+        # shield：某个配置被取消时不影响其他配置等待的同一个构建任务；结果（成功或失败）都缓存
+        self._docker_image_ready = await asyncio.shield(self._docker_image_task[1])
+        return self._docker_image_ready
+    
+    async def _run_docker_base_build_async(self) -> bool:
+        """执行 docker build 构建基础镜像"""
+        # Dockerfile 通过标准输入传给 docker，不在工作目录写临时文件
+        build_cmd = [
+            "docker", "build", 
+            "-f", "-",
+            "-t", DOCKER_BASE_IMAGE,
+            "--cache-from", DOCKER_BASE_IMAGE,
+            "--build-arg", "BUILDKIT_INLINE_CACHE=1",
+            "."
+        ]
+        env = os.environ.copy()
+        env["DOCKER_BUILDKIT"] = "1"
+        
+        try:
+            logger.info("执行Docker构建: %s", _CommandLine(build_cmd))
+            await _run_logged_async(build_cmd, Path("build") / "logs" / "docker-base.log", timeout=300, env=env,
+                                    input=self._generate_dockerfile())
+            return True
+        except subprocess.TimeoutExpired:
+            safe_print("❌ Docker基础镜像构建超时", "[ERROR] Docker base image build timeout")
+            return False
+        except subprocess.CalledProcessError as e:
+            safe_print(f"❌ Docker基础镜像构建失败: {e}", f"[ERROR] Docker base image build failed: {e}")
+            if e.stderr:
+                safe_print(f"错误详情: {e.stderr}", f"Error details: {e.stderr}")
+            return False
+        except Exception as e:
+            safe_print(f"❌ Docker基础镜像构建异常: {e}", f"[ERROR] Docker base image build exception: {e}")
+            return False
     
     def _build_with_wsl(self, config: BuildConfig, force: bool = False) -> bool:
         """使用WSL构建Linux版本"""
+        return _run_async(self._build_with_wsl_async(config, force))
+    
+    async def _build_with_wsl_async(self, config: BuildConfig, force: bool = False) -> bool:
+        """使用WSL构建Linux版本（异步）"""
         safe_print(f"🐧 使用WSL构建 {config.platform}-{config.arch}...", f"[WSL] Building {config.platform}-{config.arch} with WSL...")
         
-        # 准备WSL命令
+        # 准备WSL命令：直接执行构建脚本，不经过 shell，避免多层引号转义
+        config_json = json.dumps({"name": config.name, "platform": config.platform, "arch": config.arch})
         wsl_cmd = [
-            "wsl", "--",
-            "bash", "-c",
-            f"""
-            cd /mnt/c/Users/root/code/SaveGuard &&
-            python3 -m pip install pyinstaller>=5.13.0 &&
-            python3 -m pip install -r requirements.txt &&
-            python3 -c "
-            import subprocess
-            import sys
-            import os
-            
-            args = [
-                'pyinstaller',
-                '--onefile',
-                '--noconfirm',
-                '--clean',
-                '--noconsole',
-                '--name', '{config.name}',
-                '--distpath', 'dist',
-                '--workpath', 'build',
-                '--specpath', 'specs',
-            ]
-            
-            # 添加数据文件
-            if os.path.exists('src/languages'):
-                args.extend(['--add-data', 'src/languages:languages'])
-            if os.path.exists('src'):
-                args.extend(['--add-data', 'src:src'])
-            
-            # 排除模块
-            exclude_modules = ['tkinter', 'matplotlib', 'numpy', 'pandas', 'scipy', 'PIL', 'cv2', 'tensorflow', 'torch', 'jupyter', 'notebook', 'IPython', 'unittest', 'test', 'tests']
-            for module in exclude_modules:
-                args.extend(['--exclude-module', module])
-            
-            # 隐藏导入
-            hidden_imports = ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'psutil', 'pynput', 'pygame', 'json', 'os', 'sys', 'time', 'threading', 'pathlib', 'datetime', 'signal', 'typing', 'Xlib', 'Xlib.display', 'Xlib.X', 'Xlib.XK', 'Xlib.Xutil']
-            for module in hidden_imports:
-                args.extend(['--hidden-import', module])
-            
-            args.append('run.py')
-            
-            result = subprocess.run(args, check=True)
-            safe_print('WSL构建完成', 'WSL build completed')
-            "
-            """
+            "wsl", "--exec",
+            "python3", f"{_to_wsl_path(self._cwd)}/{WSL_BUILD_SCRIPT}", config_json
         ]
         
         try:
-            safe_print(f"执行WSL构建命令...", "Executing WSL build command...")
-            result = subprocess.run(wsl_cmd, check=True, capture_output=True, text=True)
+            logger.info("执行WSL构建命令: %s", _CommandLine(wsl_cmd))
+            await _run_logged_async(wsl_cmd, Path("build") / "logs" / f"{config}-wsl.log")
             
             # 检查输出文件
-            output_file = self.dist_dir / config.name
-            if output_file.exists():
-                size_mb = output_file.stat().st_size / (1024 * 1024)
+            output_file = config.output_path
+            size_mb = _stat_mb(output_file)
+            if size_mb is not None:
                 safe_print(f"✅ WSL构建成功: {config.name} ({size_mb:.1f} MB)", f"[SUCCESS] WSL build successful: {config.name} ({size_mb:.1f} MB)")
                 self.build_results.append({
                     "config": config,
@@ -654,6 +990,7 @@ class MultiPlatformBuilder:
                     "size_mb": size_mb,
                     "success": True
                 })
+                self._save_inputs_hash(config)
                 return True
             else:
                 safe_print(f"❌ WSL构建失败: 未找到输出文件 {config.name}", f"[ERROR] WSL build failed: output file not found {config.name}")
@@ -668,39 +1005,9 @@ class MultiPlatformBuilder:
             safe_print(f"❌ WSL构建异常: {e}", f"[ERROR] WSL build exception: {e}")
             return False
     
-    def _generate_dockerfile(self, config: BuildConfig) -> str:
-        """生成Dockerfile"""
-        if config.platform == "linux":
-            base_image = "python:3.11-slim"
-        elif config.platform == "macos":
-            base_image = "python:3.11-slim"  # 注意：macOS Docker构建有限制
-        else:
-            base_image = "python:3.11-slim"
-        
-        # 平台特定的隐藏导入
-        hidden_imports = [
-            "PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets",
-            "psutil", "pynput", "pygame", "json", "os", "sys",
-            "time", "threading", "pathlib", "datetime", "signal", "typing"
-        ]
-        
-        if config.platform == "windows":
-            hidden_imports.extend([
-                "winsound", "win32gui", "win32process", "win32api", "win32con"
-            ])
-        elif config.platform == "macos":
-            hidden_imports.extend([
-                "AppKit", "Foundation", "Quartz", "Cocoa"
-            ])
-        elif config.platform == "linux":
-            hidden_imports.extend([
-                "Xlib", "Xlib.display", "Xlib.X", "Xlib.XK", "Xlib.Xutil"
-            ])
-        
-        # 构建隐藏导入参数
-        hidden_import_args = " \\\n    ".join([f"--hidden-import {imp}" for imp in hidden_imports])
-        
-        dockerfile = f"""FROM {base_image}
+    def _generate_dockerfile(self) -> str:
+        """生成基础镜像的Dockerfile（不含具体构建目标）"""
+        dockerfile = f"""FROM {DOCKER_PYTHON_IMAGE}
 
 # 设置环境变量
 ENV PYTHONUNBUFFERED=1
@@ -724,51 +1031,22 @@ RUN apt-get update && apt-get install -y \\
 # 设置工作目录
 WORKDIR /app
 
-# 复制项目文件
-COPY . .
-
-# 安装Python依赖
+# 先安装Python依赖，依赖不变时可复用镜像缓存层
+COPY requirements.txt .
 RUN pip install --no-cache-dir --upgrade pip
-RUN pip install --no-cache-dir pyinstaller>=5.13.0
+RUN pip install --no-cache-dir "pyinstaller>=5.13.0"
 RUN pip install --no-cache-dir -r requirements.txt
 
+# 复制项目文件
+COPY . .
+
 # 创建输出目录
 RUN mkdir -p /output
 
-# 构建命令
-RUN pyinstaller \\
-    --onefile \\
-    --noconfirm \\
-    --clean \\
-    --noconsole \\
-    --name {config.name} \\
-    --distpath /output \\
-    --workpath build \\
-    --specpath specs \\
-    --add-data src/languages:languages \\
-    --add-data src:src \\
-    --exclude-module tkinter \\
-    --exclude-module matplotlib \\
-    --exclude-module numpy \\
-    --exclude-module pandas \\
-    --exclude-module scipy \\
-    --exclude-module PIL \\
-    --exclude-module cv2 \\
-    --exclude-module tensorflow \\
-    --exclude-module torch \\
-    --exclude-module jupyter \\
-    --exclude-module notebook \\
-    --exclude-module IPython \\
-    --exclude-module unittest \\
-    --exclude-module test \\
-    --exclude-module tests \\
-    {hidden_import_args} \\
-    run.py
-
 # 设置输出目录
 VOLUME ["/output"]
 
-# 默认命令
+# 默认命令（实际构建命令由 docker run 传入）
 CMD ["echo", "Build completed"]
 """
         return dockerfile
@@ -780,12 +1058,16 @@ CMD ["echo", "Build completed"]
         # 创建release目录
         self.release_dir.mkdir(exist_ok=True)
         
-        # 复制构建文件
-        for result in self.build_results:
-            if result["success"] and result["file"]:
-                dest_file = self.release_dir / result["file"].name
-                shutil.copy2(result["file"], dest_file)
-                safe_print(f"📋 复制: {result['file'].name}", f"[COPY] Copying: {result['file'].name}")
+        # 复制构建文件（各文件互不相关，并行复制）
+        pairs = [(result["file"], self.release_dir / result["file"].name)
+                 for result in self.build_results if result["success"] and result["file"]]
+        if pairs:
+            with ThreadPoolExecutor(max_workers=min(len(pairs), 8)) as executor:
+                futures = {executor.submit(_fast_copy, src, dest): src for src, dest in pairs}
+                for future in as_completed(futures):
+                    future.result()
+                    src = futures[future]
+                    safe_print(f"📋 复制: {src.name}", f"[COPY] Copying: {src.name}")
         
         # 创建README文件
         readme_content = self._generate_readme()
@@ -801,8 +1083,8 @@ CMD ["echo", "Build completed"]
         content = f"""SaveGuard v1.0 发布包
 ====================
 
-构建时间: {platform.system()} {platform.release()}
-Python版本: {sys.version}
+构建时间: {self._sys_info}
+Python版本: {self._py_version}
 
 包含的可执行文件:
 """
@@ -826,6 +1108,23 @@ Python版本: {sys.version}
 """
         return content
     
+    def _load_build_times(self) -> Dict[str, float]:
+        """读取上次记录的各配置构建耗时"""
+        try:
+            with open(BUILD_TIMES_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_build_times(self):
+        """保存各配置构建耗时，供下次构建安排顺序"""
+        try:
+            BUILD_TIMES_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(BUILD_TIMES_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.build_times, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning("无法写入构建耗时记录 %s: %s", BUILD_TIMES_FILE, e)
+    
     def show_results(self):
         """显示构建结果"""
         safe_print("\n📊 构建结果:", "\n[RESULTS] Build Results:")
@@ -864,14 +1163,15 @@ Python版本: {sys.version}
         if self.release_dir.exists():
             safe_print(f"📁 发布包目录: {self.release_dir.absolute()}", f"[DIR] Release package directory: {self.release_dir.absolute()}")
     
-    def build_all(self, platforms: Optional[List[str]] = None, force: bool = False, smart: bool = False) -> bool:
+    def build_all(self, platforms: Optional[List[str]] = None, force: bool = False, smart: bool = False,
+                  jobs: Optional[int] = None, fresh: bool = False) -> bool:
         """构建所有平台"""
         safe_print("🚀 SaveGuard 多平台构建脚本", "[SaveGuard] Multi-platform Build Script")
         safe_print("=" * 60)
-        safe_print(f"🖥️ 当前系统: {platform.system()} {platform.release()}", f"Current System: {platform.system()} {platform.release()}")
+        safe_print(f"🖥️ 当前系统: {self._sys_info}", f"Current System: {self._sys_info}")
         safe_print(f"🏗️ 当前架构: {self.current_arch}", f"Current Architecture: {self.current_arch}")
-        safe_print(f"🐍 Python版本: {sys.version}", f"Python Version: {sys.version}")
-        safe_print(f"📁 工作目录: {Path.cwd()}", f"Working Directory: {Path.cwd()}")
+        safe_print(f"🐍 Python版本: {self._py_version}", f"Python Version: {self._py_version}")
+        safe_print(f"📁 工作目录: {self._cwd}", f"Working Directory: {self._cwd}")
         
         # 检查Python版本
         if not self.check_python_version():
@@ -889,14 +1189,51 @@ Python版本: {sys.version}
             configs = self.get_build_configs(platforms)
             safe_print(f"\n📋 计划构建 {len(configs)} 个版本", f"\n[PLAN] Planning to build {len(configs)} versions")
         
-        # 构建所有配置
+        # 全新构建：删除各配置的PyInstaller工作目录，丢弃分析缓存
+        if fresh:
+            for config in configs:
+                shutil.rmtree(config.work_path, ignore_errors=True)
+        
+        # 按上次构建耗时从长到短排序，耗时最长的构建最先开始，缩短总构建时间
+        self.build_times = self._load_build_times()
+        configs = sorted(configs, key=lambda c: -self.build_times.get(c.name, 0))
+        
+        # 并行构建所有配置
         success_count = 0
-        for i, config in enumerate(configs, 1):
-            safe_print(f"\n[{i}/{len(configs)}] 构建 {config.platform}-{config.arch}", f"\n[{i}/{len(configs)}] Building {config.platform}-{config.arch}")
-            if self.build_single_platform(config, force):
-                success_count += 1
+        if configs:
+            native_configs = [c for c in configs if c.platform == self.current_platform]
+            cross_configs = [c for c in configs if c.platform != self.current_platform]
+            
+            # 需要Docker交叉构建时，先在主进程中构建一次基础镜像供所有配置复用
+            if (cross_configs and
+                self._check_docker_available() and self._verify_docker_daemon()):
+                self._ensure_docker_base_image()
+            
+            for i, config in enumerate(configs, 1):
+                safe_print(f"\n[{i}/{len(configs)}] 构建 {config.platform}-{config.arch}", f"\n[{i}/{len(configs)}] Building {config.platform}-{config.arch}")
+            
+            # 本平台构建是CPU密集型，交给进程池执行
+            workers = min(jobs or os.cpu_count() or 1, max(len(native_configs), 1))
+            logger.info("并行构建进程数: %d", workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_build_one, config.__dict__, force): config for config in native_configs}
+                
+                # 交叉构建只是等待Docker/WSL，由主进程中的事件循环并发驱动
+                if cross_configs:
+                    success_count += _run_async(self.build_cross_platforms_async(cross_configs, force))
+                
+                for future in as_completed(futures):
+                    success, results, elapsed = future.result()
+                    self.build_results.extend(results)
+                    if success:
+                        success_count += 1
+                    # 只记录实际执行的构建，跳过的构建耗时没有参考价值
+                    if any(r["success"] and not r.get("skipped", False) for r in results):
+                        self.build_times[futures[future].name] = elapsed
+            
+            self._save_build_times()
         
-        # 创建发布包
+        # 等待所有构建进程结束后再创建发布包，避免产物竞争
         if success_count > 0:
             self.create_release_package()
         
@@ -914,6 +1251,17 @@ Python版本: {sys.version}
         
         return success_count > 0
 
+def _build_one(config_dict: Dict, force: bool = False) -> Tuple[bool, List[Dict], float]:
+    """在独立进程中构建单个配置，返回 (是否成功, 构建结果列表, 耗时秒数)"""
+    platform_name = config_dict["platform"]
+    arch = config_dict["arch"]
+    config = BuildConfig(platform_name, arch, BUILD_MATRIX[platform_name][arch])
+    
+    builder = MultiPlatformBuilder()
+    start = time.perf_counter()
+    success = builder.build_single_platform(config, force)
+    return success, builder.build_results, time.perf_counter() - start
+
 def main():
     """主函数"""
     import argparse
@@ -928,6 +1276,10 @@ def main():
                        help="只构建当前平台")
     parser.add_argument("--smart", action="store_true",
                        help="智能模式：只构建当前平台能构建的版本")
+    parser.add_argument("--jobs", type=int, default=None,
+                       help="并行构建的进程数 (默认: CPU核心数)")
+    parser.add_argument("--fresh", action="store_true",
+                       help="删除PyInstaller工作目录后全新构建（默认复用分析缓存）")
     
     args = parser.parse_args()
     
@@ -946,7 +1298,7 @@ def main():
         platforms = None  # 所有平台
     
     # 执行构建
-    success = builder.build_all(platforms, args.force, args.smart)
+    success = builder.build_all(platforms, args.force, args.smart, args.jobs, args.fresh)
     
     return 0 if success else 1
 
@@ -10,21 +10,52 @@ import sys
 import subprocess
 import platform
 import shutil
+import threading
 from pathlib import Path
 
 def run_command(cmd, check=True, timeout=300):
     """运行命令并处理错误"""
     try:
         print(f"执行命令: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd, 
-            check=check, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout,
-            encoding='utf-8',
-            errors='ignore'
+        # 使用较大的管道缓冲区，并由后台线程持续读取输出，避免管道写满时阻塞子进程
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20
         )
+        stdout, stderr = bytearray(), bytearray()
+        
+        def drain(stream, buffer):
+            for chunk in iter(lambda: stream.read1(1 << 16), b''):
+                buffer.extend(chunk)
+            stream.close()
+        
+        readers = [
+            threading.Thread(target=drain, args=(process.stdout, stdout), daemon=True),
+            threading.Thread(target=drain, args=(process.stderr, stderr), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+        
+        # 输出只在结束时解码一次
+        result = subprocess.CompletedProcess(
+            cmd,
+            process.returncode,
+            stdout.decode('utf-8', errors='ignore'),
+            stderr.decode('utf-8', errors='ignore')
+        )
+        if check:
+            result.check_returncode()
         if result.stdout:
             print(f"输出: {result.stdout}")
         return result
@@ -104,13 +135,12 @@ def install_pyqt5_with_fallback():
     """使用多种方法安装 PyQt5"""
     print("🐍 安装 PyQt5...")
     
-    # 方法1: 尝试安装预编译版本
+    # 方法1: 尝试安装预编译版本（各方法之间共用 pip 缓存，后续重试时无需重新下载）
     print("方法1: 尝试安装预编译版本...")
     result = run_command([
         sys.executable, "-m", "pip", "install", 
         "PyQt5==5.15.10", 
-        "--only-binary=all",
-        "--no-cache-dir"
+        "--only-binary=all"
     ], check=False, timeout=180)
     
     if result and result.returncode == 0:
@@ -125,7 +155,6 @@ def install_pyqt5_with_fallback():
         sys.executable, "-m", "pip", "install", 
         "PyQt5==5.15.10",
         "--no-binary=PyQt5",
-        "--no-cache-dir",
         "--config-settings", f"--qmake={os.environ.get('QMAKE', 'qmake')}"
     ], check=False, timeout=600)
     
@@ -141,8 +170,7 @@ def install_pyqt5_with_fallback():
     # 安装 SIP
     sip_result = run_command([
         sys.executable, "-m", "pip", "install", 
-        "sip>=6.0.0",
-        "--no-cache-dir"
+        "sip>=6.0.0"
     ], check=False, timeout=300)
     
     if sip_result and sip_result.returncode == 0:
@@ -152,7 +180,7 @@ def install_pyqt5_with_fallback():
         result = run_command([
             sys.executable, "-m", "pip", "install", 
             "PyQt5==5.15.10",
-            "--no-cache-dir"
+            "--prefer-binary"
         ], check=False, timeout=600)
         
         if result and result.returncode == 0:
@@ -164,8 +192,7 @@ def install_pyqt5_with_fallback():
     # 方法4: 尝试使用较旧版本
     result = run_command([
         sys.executable, "-m", "pip", "install", 
-        "PyQt5==5.15.9",
-        "--no-cache-dir"
+        "PyQt5==5.15.9"
     ], check=False, timeout=600)
     
     if result and result.returncode == 0:
@@ -180,27 +207,26 @@ def install_other_dependencies():
     print("📦 安装其他依赖...")
     
     dependencies = [
-        "psutil==5.9.5",
+        "psutil==6.0.0",
         "pygame==2.5.2", 
         "pynput==1.7.6",
         "pyinstaller>=5.13.0"
     ]
     
-    for dep in dependencies:
-        print(f"安装 {dep}...")
-        result = run_command([
-            sys.executable, "-m", "pip", "install", 
-            dep,
-            "--no-cache-dir"
-        ], check=False, timeout=300)
-        
-        if result and result.returncode == 0:
-            print(f"✅ {dep} 安装成功")
-        else:
-            print(f"❌ {dep} 安装失败")
-            return False
+    # 一次 pip 调用安装全部依赖，只启动一次 pip 并统一解析依赖
+    print(f"安装 {' '.join(dependencies)}...")
+    result = run_command([
+        sys.executable, "-m", "pip", "install", 
+        "--no-cache-dir",
+        *dependencies
+    ], check=False, timeout=900)
     
-    return True
+    if result and result.returncode == 0:
+        print("✅ 其他依赖安装成功")
+        return True
+    
+    print("❌ 其他依赖安装失败")
+    return False
 
 def verify_installation():
     """验证安装"""
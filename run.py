@@ -10,7 +10,7 @@ from pathlib import Path
 
 # 检查是否在PyInstaller打包环境中
 if getattr(sys, 'frozen', False):
-    # 如果是打包后的可执行文件
+    # 如果是打包后的可执行文件（saveguard 模块已编译进归档，可直接导入）
     base_path = Path(sys._MEIPASS)
     src_dir = base_path / 'src'
 else:
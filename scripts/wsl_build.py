@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SaveGuard WSL 构建脚本
+由 build_all.py 在 WSL 中调用:
+    python3 scripts/wsl_build.py '{"name": "...", "platform": "linux", "arch": "x86_64"}'
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# 项目根目录（本文件位于 scripts/ 下）
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from build_all import build_pyinstaller_args, _package_satisfied
+
+
+def requirements_satisfied(requirements_file: Path) -> bool:
+    """检查 requirements.txt 中适用于当前平台的依赖是否都已安装"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import Requirement
+    except ImportError:
+        return False
+
+    for line in requirements_file.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        requirement = Requirement(line)
+        if requirement.marker and not requirement.marker.evaluate():
+            continue
+
+        try:
+            installed = version(requirement.name)
+        except PackageNotFoundError:
+            return False
+        if not requirement.specifier.contains(installed, prereleases=True):
+            return False
+
+    return True
+
+
+def main() -> int:
+    """主函数"""
+    config = json.loads(sys.argv[1])
+    os.chdir(ROOT)
+
+    # 依赖已满足时跳过 pip
+    if not _package_satisfied("pyinstaller", "5.13.0"):
+        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller>=5.13.0"], check=True)
+    if not requirements_satisfied(ROOT / "requirements.txt"):
+        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
+
+    env = os.environ.copy()
+    env["SAVEGUARD_BUILD_NAME"] = config["name"]
+    env["SAVEGUARD_BUILD_PLATFORM"] = config["platform"]
+
+    args = build_pyinstaller_args(
+        "dist", f"build/{config['platform']}-{config['arch']}",
+        (sys.executable, "-m", "PyInstaller"))
+    subprocess.run(args, check=True, env=env)
+    print("WSL构建完成")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
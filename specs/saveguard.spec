@@ -0,0 +1,84 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+SaveGuard PyInstaller 规格文件
+由 build_all.py 调用，目标名称、平台和图标通过环境变量传入:
+    SAVEGUARD_BUILD_NAME      可执行文件名称
+    SAVEGUARD_BUILD_PLATFORM  目标平台 (windows / macos / linux)
+    SAVEGUARD_BUILD_ICON      图标文件路径（可选）
+"""
+
+import os
+import sys
+
+# 项目根目录（本文件位于 specs/ 下）
+ROOT = os.path.abspath(os.path.join(SPECPATH, os.pardir))
+
+_DEFAULT_PLATFORM = {"win32": "windows", "darwin": "macos"}.get(sys.platform, "linux")
+
+name = os.environ.get("SAVEGUARD_BUILD_NAME", "SaveGuard")
+target_platform = os.environ.get("SAVEGUARD_BUILD_PLATFORM", _DEFAULT_PLATFORM)
+icon = os.environ.get("SAVEGUARD_BUILD_ICON") or None
+
+# 排除不必要的模块
+excludes = [
+    "tkinter", "matplotlib", "numpy", "pandas", "scipy",
+    "PIL", "cv2", "tensorflow", "torch", "jupyter",
+    "notebook", "IPython", "unittest", "test", "tests"
+]
+
+# 隐藏导入
+hiddenimports = [
+    "PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets",
+    "psutil", "pynput", "pygame", "json", "os", "sys",
+    "time", "threading", "pathlib", "datetime", "signal", "typing",
+    "saveguard", "language_manager",
+]
+
+# 平台特定隐藏导入
+platform_hidden_imports = {
+    "windows": ["winsound", "win32gui", "win32process", "win32api", "win32con"],
+    "macos": ["AppKit", "Foundation", "Quartz", "Cocoa"],
+    "linux": ["Xlib", "Xlib.display", "Xlib.X", "Xlib.XK", "Xlib.Xutil"],
+}
+hiddenimports += platform_hidden_imports.get(target_platform, [])
+
+# 数据文件（src 下的模块通过 pathex 编译进 PYZ 归档，不再作为源码文件复制）
+datas = []
+if os.path.isdir(os.path.join(ROOT, "src", "languages")):
+    datas.append((os.path.join(ROOT, "src", "languages"), "languages"))
+
+a = Analysis(
+    [os.path.join(ROOT, "run.py")],
+    pathex=[ROOT, os.path.join(ROOT, "src")],
+    binaries=[],
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+# 单文件、无控制台窗口
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name=name,
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=icon,
+)
@@ -5,11 +5,33 @@ SaveGuard 多语言支持管理器
 Language Manager for SaveGuard
 """
 
-import json
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
-from PyQt5.QtCore import QObject, pyqtSignal, QSettings
+from typing import Dict, Any, Optional, Iterator, Tuple
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QSettings, QTimer
+
+# 优先使用 orjson 解析语言文件（可选依赖），不可用时回退到标准库
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# 语言文件目录
+_LANG_DIR = Path(__file__).parent / "languages"
+
+# 翻译查找未命中的标记
+_MISSING = object()
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """将嵌套的翻译字典展开为点分隔的键，如 {"app": {"title": ...}} -> ("app.title", ...)"""
+    for k, v in data.items():
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{prefix}{k}.")
+        else:
+            yield f"{prefix}{k}", v
 
 
 class LanguageManager(QObject):
@@ -23,6 +45,7 @@ class LanguageManager(QObject):
         self.current_language = "zh_CN"  # 默认中文
         self.translations = {}
         self.settings = QSettings("SaveGuard", "SaveGuard")
+        self._sync_pending = False
         
         # 支持的语言列表
         self.supported_languages = {
@@ -35,8 +58,9 @@ class LanguageManager(QObject):
         # 加载保存的语言设置
         self.load_language_setting()
         
-        # 加载当前语言的翻译
+        # 加载当前语言的翻译，其他语言在后台预加载
         self.load_language(self.current_language)
+        self._preload_languages()
     
     def load_language_setting(self):
         """加载保存的语言设置"""
@@ -44,9 +68,27 @@ class LanguageManager(QObject):
         if saved_language in self.supported_languages:
             self.current_language = saved_language
     
+    def _preload_languages(self):
+        """在后台线程中预加载其余语言，避免启动时阻塞界面"""
+        pending = [code for code in self.supported_languages if code not in self.translations]
+        if not pending:
+            return
+        executor = ThreadPoolExecutor(max_workers=2)
+        for code in pending:
+            executor.submit(self.load_language, code)
+        executor.shutdown(wait=False)
+    
     def save_language_setting(self):
         """保存语言设置"""
         self.settings.setValue("language", self.current_language)
+        # 延迟写入磁盘，连续切换语言时只写入一次（退出时 Qt 也会自动同步）
+        if not self._sync_pending:
+            self._sync_pending = True
+            QTimer.singleShot(500, Qt.CoarseTimer, self._sync_settings)
+    
+    def _sync_settings(self):
+        """将语言设置写入磁盘"""
+        self._sync_pending = False
         self.settings.sync()
     
     def get_supported_languages(self) -> Dict[str, str]:
@@ -64,7 +106,8 @@ class LanguageManager(QObject):
         
         if self.current_language != language_code:
             self.current_language = language_code
-            self.load_language(language_code)
+            if language_code not in self.translations:
+                self.load_language(language_code)
             self.save_language_setting()
             self.language_changed.emit(language_code)
         return True
@@ -75,9 +118,9 @@ class LanguageManager(QObject):
             # 获取语言文件路径
             lang_file = self.get_language_file_path(language_code)
             
-            if os.path.exists(lang_file):
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations[language_code] = json.load(f)
+            if lang_file.is_file():
+                # 加载时展开为单层字典，翻译时只需一次查找
+                self.translations[language_code] = dict(_flatten(_loads(lang_file.read_bytes())))
             else:
                 # 如果语言文件不存在，使用中文作为默认语言
                 print(f"⚠ 语言文件不存在: {lang_file}")
@@ -99,47 +142,31 @@ class LanguageManager(QObject):
             # 使用空字典
             self.translations[language_code] = {}
     
-    def get_language_file_path(self, language_code: str) -> str:
+    def get_language_file_path(self, language_code: str) -> Path:
         """获取语言文件路径"""
-        current_dir = Path(__file__).parent
-        return current_dir / "languages" / f"{language_code}.json"
+        return _LANG_DIR / f"{language_code}.json"
     
     
     def translate(self, key: str, **kwargs) -> str:
         """翻译文本"""
-        try:
-            # 分割键路径
-            keys = key.split('.')
-            value = self.translations.get(self.current_language, {})
-            
-            # 遍历键路径
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    # 如果找不到翻译，尝试使用中文作为默认语言
-                    if self.current_language != "zh_CN":
-                        value = self.translations.get("zh_CN", {})
-                        for k in keys:
-                            if isinstance(value, dict) and k in value:
-                                value = value[k]
-                            else:
-                                return key  # 返回原始键
-                    else:
-                        return key  # 返回原始键
-            
-            # 格式化字符串
-            if isinstance(value, str) and kwargs:
-                try:
-                    return value.format(**kwargs)
-                except (KeyError, ValueError):
-                    return value
-            
-            return str(value) if value is not None else key
-            
-        except Exception as e:
-            print(f"✗ 翻译失败: {e}")
-            return key
+        value = self.translations.get(self.current_language, {}).get(key, _MISSING)
+        # 如果找不到翻译，尝试使用中文作为默认语言
+        if value is _MISSING and self.current_language != "zh_CN":
+            # 中文翻译只在第一次找不到键时加载（通常已由后台预加载）
+            if "zh_CN" not in self.translations:
+                self.load_language("zh_CN")
+            value = self.translations["zh_CN"].get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return key  # 返回原始键
+        
+        # 格式化字符串
+        if isinstance(value, str) and kwargs:
+            try:
+                return value.format(**kwargs)
+            except (KeyError, ValueError):
+                return value
+        
+        return str(value)
     
     def tr(self, key: str, **kwargs) -> str:
         """翻译文本的简写方法"""
@@ -11,16 +11,30 @@ Github: https://github.com/rootwhois/saveguard
 import sys
 import os
 import time
+import select
+import socket
+import struct
 import threading
 import json
+import logging
+import re
 import signal
+import importlib.util
+import heapq
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
 # 导入语言管理器
 from language_manager import get_language_manager, tr
 
+# 诊断日志（默认输出启动信息和警告，设置环境变量 SAVEGUARD_LOG_LEVEL=DEBUG 可查看详细信息）
+logger = logging.getLogger(__name__)
+
 # 版本信息
 VERSION = "1.0"
 GITHUB_URL = "https://github.com/rootwhois/saveguard"
@@ -32,108 +46,708 @@ try:
 except ImportError:
     HAS_WINSOUND = False
 
+# pygame 在第一次播放声音时才导入并初始化音频设备（见 _ensure_pygame）
+pygame = None
+HAS_PYGAME = importlib.util.find_spec("pygame") is not None
+
+
+def _ensure_pygame() -> bool:
+    """导入 pygame 并初始化 mixer，成功返回 True"""
+    global pygame, HAS_PYGAME
+    if pygame is None and HAS_PYGAME:
+        try:
+            import pygame as _pygame
+            _pygame.mixer.init()
+            pygame = _pygame
+        except Exception as e:
+            print(f"初始化 pygame 失败: {e}")
+            HAS_PYGAME = False
+    return pygame is not None
+
+# Windows 窗口操作支持
 try:
-    import pygame
-    pygame.mixer.init()
-    HAS_PYGAME = True
+    import win32gui
+    import win32process
+    HAS_WIN32GUI = True
 except ImportError:
-    HAS_PYGAME = False
+    HAS_WIN32GUI = False
+
+# 键盘模拟支持：pynput 在第一次需要模拟按键时才导入（导入时会加载平台输入后端，见 _ensure_pynput）
+keyboard = Key = None
+HAS_PYNPUT = importlib.util.find_spec("pynput") is not None
+
+
+def _ensure_pynput() -> bool:
+    """导入 pynput 键盘模块，成功返回 True"""
+    global keyboard, Key, HAS_PYNPUT
+    if keyboard is None and HAS_PYNPUT:
+        try:
+            from pynput import keyboard as _keyboard
+            Key = _keyboard.Key
+            keyboard = _keyboard
+        except Exception as e:
+            print(f"导入 pynput 失败: {e}")
+            HAS_PYNPUT = False
+    return keyboard is not None
 
-# 键盘模拟支持
+# 多模式子串匹配支持（可选依赖 pyahocorasick）
 try:
-    from pynput import keyboard
-    from pynput.keyboard import Key, Listener
-    HAS_PYNPUT = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_PYNPUT = False
+    HAS_AHOCORASICK = False
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QPushButton, QMenu, QSystemTrayIcon,
                            QMessageBox, QInputDialog, QFileDialog, QSpinBox,
                            QCheckBox, QGroupBox, QTextEdit, QFrame, QComboBox,
-                           QSlider, QTabWidget, QListWidget, QListWidgetItem,
-                           QDialog, QDialogButtonBox, QFormLayout, QLineEdit)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QPoint, QSettings
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QCursor, QPainter, QColor
+                           QSlider, QTabWidget, QListWidget,
+                           QDialog, QDialogButtonBox, QFormLayout, QLineEdit, QAction,
+                           QListView)
+from PyQt5.QtCore import (Qt, QObject, QTimer, QThread, pyqtSignal, QPoint, QSettings,
+                          QAbstractListModel, QModelIndex)
+from PyQt5.QtGui import QIcon, QPixmap, QFont, QCursor, QPainter, QColor, QBrush
 import psutil
 
+# 样式表（模块加载时创建一次，每个控件复用同一个字符串）
 
-class ProgramMonitorThread(QThread):
-    """程序监控线程"""
-    program_started = pyqtSignal(str, str)  # 程序启动信号 (程序名, 进程ID)
-    program_stopped = pyqtSignal(str)  # 程序停止信号 (程序名)
+# 气泡提示
+_STYLE_BUBBLE_BACKGROUND = """
+    QFrame {
+        background-color: rgba(50, 50, 50, 220);
+        border-radius: 8px;
+        border: 1px solid rgba(255, 255, 255, 150);
+    }
+"""
+_STYLE_BUBBLE_TITLE = """
+    QLabel {
+        color: #FFD700;
+        font-weight: bold;
+        font-size: 14px;
+    }
+"""
+_STYLE_BUBBLE_MESSAGE = """
+    QLabel {
+        color: white;
+        font-size: 12px;
+    }
+"""
+_STYLE_BUBBLE_SAVE_BUTTON = """
+    QPushButton {
+        background-color: rgba(0, 150, 0, 200);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 100);
+        border-radius: 6px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 100px;
+        min-height: 35px;
+    }
+    QPushButton:hover {
+        background-color: rgba(0, 180, 0, 200);
+        transform: scale(1.05);
+    }
+    QPushButton:pressed {
+        background-color: rgba(0, 120, 0, 200);
+    }
+"""
+
+# 主浮窗
+_STYLE_MAIN_BACKGROUND = """
+    QFrame {
+        background-color: rgba(50, 50, 50, 200);
+        border-radius: 10px;
+        border: 1px solid rgba(255, 255, 255, 100);
+    }
+"""
+_STYLE_MAIN_TITLE = """
+    QLabel {
+        color: white;
+        font-weight: bold;
+        font-size: 16px;
+    }
+"""
+_STYLE_STATUS = """
+    QLabel {
+        color: #90EE90;
+        font-size: 12px;
+    }
+"""
+_STYLE_PROGRAM_COUNT = """
+    QLabel {
+        color: #87CEEB;
+        font-size: 11px;
+    }
+"""
+
+# 状态标签：监控中 / 等待程序
+_STYLE_STATUS_ACTIVE = """
+    QLabel {
+        color: #90EE90;
+        font-size: 10px;
+    }
+"""
+_STYLE_STATUS_WAITING = """
+    QLabel {
+        color: #FFB6C1;
+        font-size: 10px;
+    }
+"""
+
+# 应用程序选择对话框：整个对话框只设置一次样式表，各控件通过对象名匹配
+_STYLE_DIALOG_BUTTON = """
+    QPushButton#{name} {{
+        background-color: {background};
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    QPushButton#{name}:hover {{
+        background-color: {hover};
+    }}
+"""
+_STYLE_APP_SELECTION = """
+    QLabel#infoLabel {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QLabel#loadingLabel {
+        font-size: 12px;
+        color: #666;
+        padding: 5px;
+    }
+    QListView {
+        font-size: 12px;
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QListView::item {
+        padding: 8px;
+        border-bottom: 1px solid #eee;
+    }
+    QListView::item:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+""" + "".join(_STYLE_DIALOG_BUTTON.format(name=name, background=background, hover=hover)
+              for name, background, hover in (("refreshButton", "#0078d4", "#106ebe"),
+                                              ("selectAllButton", "#28a745", "#218838"),
+                                              ("clearButton", "#dc3545", "#c82333")))
+
+
+class IntervalWaiter:
+    """周期等待器，用于监控线程的轮询循环
     
-    def __init__(self, target_programs: List[str]):
-        super().__init__()
-        self.target_programs = [p.lower() for p in target_programs]  # 转换为小写便于比较
-        self.running = True
-        self.running_programs = {}  # {程序名: 进程ID}
+    Linux（Python 3.13+ 提供 os.timerfd_create）上使用 timerfd 按固定周期唤醒，周期不随每次循环的耗时漂移，
+    并通过 eventfd 响应停止请求；其他平台回退到 threading.Event.wait。
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
         self._stop_event = threading.Event()
+        self._timer_fd = None
+        self._stop_fd = None
+        if hasattr(os, "timerfd_create"):
+            try:
+                self._timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC)
+                os.timerfd_settime(self._timer_fd, initial=interval, interval=interval)
+                self._stop_fd = os.eventfd(0, flags=os.EFD_CLOEXEC)
+            except OSError:
+                self.close()
+    
+    def wait(self) -> bool:
+        """等待下一个周期，返回 True 表示已请求停止"""
+        if self._stop_fd is None:
+            return self._stop_event.wait(self.interval)
+        readable, _, _ = select.select([self._timer_fd, self._stop_fd], [], [])
+        if self._stop_fd in readable:
+            return True
+        os.read(self._timer_fd, 8)
+        return self._stop_event.is_set()
+    
+    def is_set(self) -> bool:
+        return self._stop_event.is_set()
+    
+    def set(self):
+        """请求停止，唤醒正在等待的线程"""
+        self._stop_event.set()
+        if self._stop_fd is not None:
+            os.eventfd_write(self._stop_fd, 1)
+    
+    def close(self):
+        """关闭文件描述符（需在等待线程结束后调用）"""
+        for fd in (self._timer_fd, self._stop_fd):
+            if fd is not None:
+                os.close(fd)
+        self._timer_fd = self._stop_fd = None
+
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    
+    _psapi = ctypes.WinDLL("psapi", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD))
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _pid_buffer = (wintypes.DWORD * 4096)()
+    
+    def _win_enum_pids() -> Set[int]:
+        """通过 EnumProcesses 获取全部进程ID，比 psutil.pids() 少一层封装"""
+        global _pid_buffer
+        while True:
+            needed = wintypes.DWORD()
+            if not _psapi.EnumProcesses(_pid_buffer, ctypes.sizeof(_pid_buffer), ctypes.byref(needed)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            count = needed.value // ctypes.sizeof(wintypes.DWORD)
+            if count < len(_pid_buffer):
+                return set(_pid_buffer[:count])
+            # 缓冲区已满，可能还有更多进程，扩大后重试
+            _pid_buffer = (wintypes.DWORD * (len(_pid_buffer) * 2))()
+    
+    def _win_process_name(pid: int) -> Optional[str]:
+        """通过 QueryFullProcessImageNameW 获取进程名，无法访问时返回 None"""
+        handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            buf = ctypes.create_unicode_buffer(1024)
+            size = wintypes.DWORD(len(buf))
+            if not _kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                return None
+            path = buf.value
+            return path[path.rfind('\\') + 1:]
+        finally:
+            _kernel32.CloseHandle(handle)
+    
+    class _PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+    
+    _TH32CS_SNAPPROCESS = 0x00000002
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    _kernel32.Process32FirstW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W))
+    _kernel32.Process32NextW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W))
+    
+    def _win_snapshot_processes():
+        """通过一次 CreateToolhelp32Snapshot 快照生成 (进程ID, 进程名)，无需逐个打开进程"""
+        snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+        if snapshot == _INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            entry = _PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+            ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while ok:
+                yield entry.th32ProcessID, entry.szExeFile
+                ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            _kernel32.CloseHandle(snapshot)
+
+
+def _iter_process_names():
+    """遍历全部进程，生成 (进程ID, 进程名或None)
+    
+    Linux 直接读取 /proc/<pid>/comm，Windows 使用一次进程快照，只获取匹配所需的进程名，
+    其他平台使用 psutil.process_iter。
+    """
+    if sys.platform.startswith("linux"):
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                with open(f"/proc/{pid}/comm", "rb") as f:
+                    name = f.read().rstrip(b"\n").decode("utf-8", "replace")
+                # comm 最长15个字符，可能被截断时由 psutil 读取完整名称
+                if len(name) >= 15:
+                    name = psutil.Process(pid).name()
+            except (OSError, psutil.Error):
+                name = None
+            yield pid, name
+    elif sys.platform == "win32":
+        yield from _win_snapshot_processes()
+    else:
+        for proc in psutil.process_iter(['pid', 'name']):
+            yield proc.info['pid'], proc.info['name']
+
+
+# 进程缓存 {进程ID: (小写进程名或None, 匹配的目标程序名或None)}；保留进程名，更换目标程序时无需重新查询进程
+PidCache = Dict[int, Tuple[Optional[str], Optional[str]]]
+
+
+class ProgramMatcher:
+    """目标程序匹配和进程缓存，由轮询监控和事件驱动监控共用
+    
+    子类需要定义 programs_delta 信号，并在初始化时调用 _init_matcher。
+    """
+    
+    def _init_matcher(self, target_programs: List[str], pid_cache: Optional[PidCache] = None):
+        """初始化匹配表；pid_cache 为已有的进程扫描结果（如启动扫描），首次轮询时只需查询新出现的进程"""
+        self.running_programs = {}  # {程序名: 进程ID}
+        self._pid_cache: PidCache = dict(pid_cache) if pid_cache else {}
+        self._scratch: Dict[str, int] = {}  # 每次扫描复用的结果字典
+        # 保护匹配表、PID缓存和运行列表：监控线程扫描时，GUI线程可能同时更换目标程序或读取数量
+        # 使用可重入锁：轮询模式下信号在持锁时直接回调到GUI槽函数，槽函数中会再次读取数量
+        self._lock = threading.RLock()
+        self._set_targets(target_programs)
+    
+    def _set_targets(self, target_programs: List[str]):
+        """设置目标程序并预先计算匹配表"""
+        self.target_programs = [p.lower() for p in target_programs]  # 转换为小写便于比较
         
-    def run(self):
-        while self.running and not self._stop_event.is_set():
+        # 预先计算匹配表：目标名称及去掉.exe后的名称都映射到目标程序名，精确匹配只需一次字典查找
+        self._exact_targets: Dict[str, str] = {}
+        for target in self.target_programs:
+            self._exact_targets.setdefault(target, target)
+            self._exact_targets.setdefault(target.replace('.exe', ''), target)
+        
+        # 子串匹配：目标程序名出现在进程名中。可用时预编译为 Aho-Corasick 自动机，一次扫描匹配全部目标
+        self._automaton = None
+        substring_targets = [t for t in self.target_programs if len(t) > 3]
+        if HAS_AHOCORASICK and substring_targets:
+            self._automaton = ahocorasick.Automaton()
+            for target in substring_targets:
+                self._automaton.add_word(target, target)
+            self._automaton.make_automaton()
+    
+    def update_targets(self, target_programs: List[str]):
+        """更换目标程序列表（可在GUI线程中调用）
+        
+        只对缓存的进程名重新匹配，不查询进程；之后新启动的进程由下一次轮询或进程事件补充。
+        """
+        with self._lock:
+            self._set_targets(target_programs)
             try:
-                current_running = self._get_running_programs()
-                
-                # 检查新启动的程序
-                for program_name, pid in current_running.items():
-                    if program_name not in self.running_programs:
-                        self.program_started.emit(program_name, str(pid))
-                        self.running_programs[program_name] = pid
-                
-                # 检查停止的程序
-                for program_name in list(self.running_programs.keys()):
-                    if program_name not in current_running:
-                        self.program_stopped.emit(program_name)
-                        del self.running_programs[program_name]
-                        
+                for pid, (name, _) in self._pid_cache.items():
+                    self._pid_cache[pid] = (name, self._match_target(name) if name else None)
+                self._update_running_programs(self._running_from_cache())
             except Exception as e:
-                print(f"程序监控错误: {e}")
-            
-            # 使用事件等待，可以更快响应停止信号
-            if self._stop_event.wait(2):  # 等待2秒或直到停止事件
-                break
+                logger.warning("程序监控错误: %s", e)
+    
+    def snapshot_count(self) -> int:
+        """返回当前运行的目标程序数量（加锁读取，可在任意线程调用）"""
+        with self._lock:
+            return len(self.running_programs)
+    
+    def poll(self):
+        """扫描一次进程列表并发出程序启动/停止信号"""
+        try:
+            with self._lock:
+                self._update_running_programs(self._get_running_programs())
+        except Exception as e:
+            print(f"程序监控错误: {e}")
+    
+    def _update_running_programs(self, current_running: Dict[str, int]):
+        """与上次结果对比，将本次启动和停止的程序合并为一次 programs_delta 信号发出"""
+        # 检查新启动的程序
+        started = []
+        for program_name, pid in current_running.items():
+            if program_name not in self.running_programs:
+                started.append((program_name, str(pid)))
+                self.running_programs[program_name] = pid
+        
+        # 检查停止的程序
+        stopped = [name for name in self.running_programs if name not in current_running]
+        for program_name in stopped:
+            del self.running_programs[program_name]
+        
+        if started or stopped:
+            self.programs_delta.emit(started, stopped)
     
     def _get_running_programs(self) -> Dict[str, int]:
-        """获取当前运行的目标程序列表"""
-        running_programs = {}
+        """获取当前运行的目标程序列表
+        
+        按PID缓存每个进程的匹配结果，每次只读取新出现进程的名称，并移除已退出的进程。
+        Windows 上直接调用 EnumProcesses / QueryFullProcessImageNameW，其他平台使用 psutil。
+        """
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['name']:
-                        proc_name = proc_info['name'].lower()
-                        # 移除.exe扩展名进行匹配
-                        proc_name_no_ext = proc_name.replace('.exe', '')
-                        # 检查是否为目标程序
-                        for target in self.target_programs:
-                            target_lower = target.lower()
-                            target_no_ext = target_lower.replace('.exe', '')
-                            # 支持多种匹配方式
-                            if (target_lower == proc_name or 
-                                target_lower == proc_name_no_ext or
-                                target_no_ext == proc_name or
-                                target_no_ext == proc_name_no_ext or
-                                (target_lower in proc_name and len(target_lower) > 3) or
-                                (proc_name in target_lower and len(proc_name) > 3)):
-                                running_programs[target_lower] = proc_info['pid']
-                                break
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            current_pids = _win_enum_pids() if sys.platform == "win32" else set(psutil.pids())
+            for pid in self._pid_cache.keys() - current_pids:
+                del self._pid_cache[pid]
+            for pid in current_pids - self._pid_cache.keys():
+                if sys.platform == "win32":
+                    # 无法访问的进程（如系统进程）同样缓存为 None，不再重复查询
+                    proc_name = _win_process_name(pid)
+                else:
+                    try:
+                        proc_name = psutil.Process(pid).name()
+                    except psutil.NoSuchProcess:
+                        continue
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        # 无权访问的进程不再重复查询
+                        proc_name = None
+                proc_name = proc_name.lower() if proc_name else None
+                self._pid_cache[pid] = (proc_name, self._match_target(proc_name) if proc_name else None)
+            
         except Exception as e:
             print(f"获取运行程序列表错误: {e}")
-        return running_programs
+        return self._running_from_cache()
+    
+    def _running_from_cache(self) -> Dict[str, int]:
+        """根据PID缓存生成 {目标程序名: 进程ID}
+        
+        返回的字典在每次扫描时原地清空复用，调用方不应长期持有。
+        """
+        running = self._scratch
+        running.clear()
+        for pid, (_, target) in self._pid_cache.items():
+            if target is not None:
+                running[target] = pid
+        return running
+    
+    def _match_target(self, proc_name: str) -> Optional[str]:
+        """返回进程名对应的目标程序名，未匹配时返回 None"""
+        # 移除.exe扩展名进行匹配
+        proc_name_no_ext = proc_name[:-4] if proc_name.endswith('.exe') else proc_name
+        target = self._exact_targets.get(proc_name) or self._exact_targets.get(proc_name_no_ext)
+        if target is not None:
+            return target
+        
+        # 精确匹配失败时才进行子串匹配
+        long_name = len(proc_name) > 3
+        if self._automaton is not None:
+            for _, target in self._automaton.iter(proc_name):
+                return target
+            if not long_name:
+                return None
+            for target in self.target_programs:
+                if proc_name in target:
+                    return target
+            return None
+        for target in self.target_programs:
+            if (len(target) > 3 and target in proc_name) or (long_name and proc_name in target):
+                return target
+        return None
+    
+
+
+class ProgramMonitor(ProgramMatcher, QObject):
+    """程序监控器，在GUI线程中由 QTimer 每2秒轮询一次
+    
+    轮询只需要很短的时间，不再单独创建线程；信号在同一线程内发出，直接调用槽函数。
+    """
+    programs_delta = pyqtSignal(list, list)  # 程序变化信号 ([(程序名, 进程ID)], [停止的程序名])
+    
+    def __init__(self, target_programs: List[str], parent=None, pid_cache=None):
+        QObject.__init__(self, parent)
+        self._init_matcher(target_programs, pid_cache)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.CoarseTimer)  # 轮询不需要毫秒级精度
+        self._timer.timeout.connect(self.poll)
+    
+    def start(self):
+        self.poll()
+        self._timer.start(2000)
+    
+    def isRunning(self) -> bool:
+        return self._timer.isActive()
+    
+    def stop(self):
+        self._timer.stop()
+
+
+class EventDrivenProgramMonitor(ProgramMatcher, QThread):
+    """基于系统进程事件的程序监控线程
+    
+    Linux 使用 netlink 进程连接器（需要 CAP_NET_ADMIN），Windows 使用 WMI 进程创建/删除事件，
+    空闲时不再每2秒扫描一次进程列表。事件源不可用时在本线程中回退到每2秒轮询。
+    """
+    programs_delta = pyqtSignal(list, list)  # 程序变化信号 ([(程序名, 进程ID)], [停止的程序名])
+    
+    # netlink 进程连接器常量（linux/connector.h, linux/cn_proc.h）
+    NETLINK_CONNECTOR = 11
+    CN_IDX_PROC = 1
+    CN_VAL_PROC = 1
+    NLMSG_DONE = 3
+    PROC_CN_MCAST_LISTEN = 1
+    PROC_EVENT_EXEC = 0x00000002
+    PROC_EVENT_EXIT = 0x80000000
+    
+    # WMI 等待事件超时错误码 wbemErrTimedOut (0x80043001)，COM 错误码为有符号整数
+    WBEM_E_TIMED_OUT = 0x80043001 - (1 << 32)
+    
+    def __init__(self, target_programs: List[str], pid_cache=None):
+        QThread.__init__(self)
+        self._init_matcher(target_programs, pid_cache)
+        self.running = True
+        self._waiter = IntervalWaiter(2)
+        self._wakeup_r, self._wakeup_w = (os.pipe() if sys.platform.startswith("linux") else (None, None))
+    
+    def run(self):
+        try:
+            if sys.platform.startswith("linux"):
+                events = self._linux_events()
+            elif sys.platform == "win32":
+                events = self._windows_events()
+            else:
+                events = None
+            if events is not None:
+                # 先完整扫描一次，之后只处理进程事件
+                self.poll()
+                for pid, name in events:
+                    self._handle_process_event(pid, name)
+                return
+        except Exception as e:
+            print(f"进程事件监控不可用，改用轮询: {e}")
+        
+        while self.running and not self._waiter.is_set():
+            self.poll()
+            # 等待下一个周期（2秒），可以更快响应停止信号
+            if self._waiter.wait():
+                break
+    
+    def _handle_process_event(self, pid: int, name: Optional[str]):
+        """处理进程启动（name 为进程名）或退出（name 为 None）事件"""
+        with self._lock:
+            _, previous = self._pid_cache.pop(pid, (None, None))
+            name = name.lower() if name else name
+            target = self._match_target(name) if name else None
+            if name is not None:
+                self._pid_cache[pid] = (name, target)
+            # 与目标程序无关的进程事件不需要重新对比
+            if previous is None and target is None:
+                return
+            self._update_running_programs(self._running_from_cache())
+    
+    def _linux_events(self):
+        """订阅 netlink 进程事件，返回 (pid, 进程名或None) 生成器；无权限时抛出 OSError"""
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, self.NETLINK_CONNECTOR)
+        try:
+            sock.bind((0, self.CN_IDX_PROC))
+            op = struct.pack("=I", self.PROC_CN_MCAST_LISTEN)
+            cn_msg = struct.pack("=IIIIHH", self.CN_IDX_PROC, self.CN_VAL_PROC, 0, 0, len(op), 0) + op
+            sock.send(struct.pack("=IHHII", 16 + len(cn_msg), self.NLMSG_DONE, 0, 0, os.getpid()) + cn_msg)
+        except OSError:
+            sock.close()
+            raise
+        return self._read_linux_events(sock)
+    
+    def _read_linux_events(self, sock):
+        """读取 netlink 进程事件，直到收到停止通知"""
+        with sock:
+            while self.running:
+                readable, _, _ = select.select([sock, self._wakeup_r], [], [])
+                if self._wakeup_r in readable:
+                    break
+                data = sock.recv(4096)
+                # nlmsghdr(16) + cn_msg(20) + proc_event 头部(what, cpu, timestamp)(16) + 事件数据
+                if len(data) < 60:
+                    continue
+                what = struct.unpack_from("=I", data, 36)[0]
+                pid, tgid = struct.unpack_from("=II", data, 52)
+                if what == self.PROC_EVENT_EXEC:
+                    try:
+                        yield tgid, psutil.Process(tgid).name()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                        continue
+                elif what == self.PROC_EVENT_EXIT and pid == tgid:
+                    yield tgid, None
+    
+    def _windows_events(self):
+        """订阅 WMI Win32_Process 创建/删除事件，返回 (pid, 进程名或None) 生成器"""
+        import pythoncom
+        import win32com.client
+        
+        pythoncom.CoInitialize()
+        try:
+            watcher = win32com.client.GetObject("winmgmts:").ExecNotificationQuery(
+                "SELECT * FROM __InstanceOperationEvent WITHIN 1 "
+                "WHERE TargetInstance ISA 'Win32_Process' "
+                "AND __CLASS <> '__InstanceModificationEvent'")  # 只订阅创建/删除，进程属性变化不产生事件
+        except Exception:
+            pythoncom.CoUninitialize()
+            raise
+        return self._read_windows_events(watcher, pythoncom)
+    
+    def _read_windows_events(self, watcher, pythoncom):
+        """读取 WMI 进程事件，直到收到停止通知"""
+        import pywintypes
+        
+        try:
+            while self.running and not self._waiter.is_set():
+                try:
+                    # 最多等待1秒，以便及时响应停止信号
+                    event = watcher.NextEvent(1000)
+                except pywintypes.com_error as e:
+                    # 只忽略等待超时；WMI 断开等其他错误向上抛出，由 run() 改用轮询
+                    scode = e.excepinfo[5] if e.excepinfo else None
+                    if self.WBEM_E_TIMED_OUT in (e.hresult, scode):
+                        continue
+                    raise
+                event_class = event.Path_.Class
+                process = event.TargetInstance
+                if event_class == "__InstanceCreationEvent":
+                    yield int(process.ProcessId), process.Name
+                elif event_class == "__InstanceDeletionEvent":
+                    yield int(process.ProcessId), None
+        finally:
+            pythoncom.CoUninitialize()
     
     def stop(self):
         self.running = False
-        self._stop_event.set()
+        self._waiter.set()
+        if self._wakeup_w is not None:
+            os.write(self._wakeup_w, b"\0")
         if self.isRunning():
             self.quit()
             self.wait(3000)  # 最多等待3秒
+        if self.isRunning():
+            return
+        self._waiter.close()
+        if self._wakeup_w is not None:
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+            self._wakeup_r = self._wakeup_w = None
+
+
+def create_program_monitor(target_programs: List[str], parent=None,
+                           pid_cache: Optional[PidCache] = None) -> ProgramMatcher:
+    """创建程序监控器：支持进程事件的平台使用事件驱动监控线程，否则在GUI线程中定时轮询"""
+    if sys.platform == "win32" or sys.platform.startswith("linux"):
+        return EventDrivenProgramMonitor(target_programs, pid_cache)
+    return ProgramMonitor(target_programs, parent, pid_cache)
 
 
 class RemindConfig:
     """提醒配置类"""
+    
+    # 默认提醒消息的键
+    MESSAGE_KEYS = ("default", "code", "document", "design", "welcome", "hourly")
+    # 各语言的默认提醒消息缓存 {语言代码: {键: 消息}}
+    _messages_cache: Dict[str, Dict[str, str]] = {}
+    
+    @classmethod
+    def default_messages(cls) -> Dict[str, str]:
+        """获取当前语言的默认提醒消息，每种语言只翻译一次"""
+        language = get_language_manager().get_current_language()
+        messages = cls._messages_cache.get(language)
+        if messages is None:
+            messages = cls._messages_cache[language] = {key: tr(f"messages.{key}") for key in cls.MESSAGE_KEYS}
+        return dict(messages)
+    
     def __init__(self):
         self.interval_seconds = 300  # 提醒间隔（秒），默认5分钟
         self.sound_enabled = True  # 是否启用声音
@@ -144,14 +758,7 @@ class RemindConfig:
         self.welcome_message_enabled = True  # 是否显示程序打开欢迎消息
         self.auto_select_apps = True  # 是否自动选择应用程序
         self.language = "zh_CN"  # 语言设置
-        self.remind_messages = {
-            "default": tr("messages.default"),
-            "code": tr("messages.code"),
-            "document": tr("messages.document"),
-            "design": tr("messages.design"),
-            "welcome": tr("messages.welcome"),
-            "hourly": tr("messages.hourly")
-        }
+        self.remind_messages = self.default_messages()
         
     def to_dict(self):
         return {
@@ -176,22 +783,23 @@ class RemindConfig:
 class RemindHistory:
     """提醒历史记录"""
     def __init__(self):
-        self.history = []
         self.max_records = 100
+        self.history = deque(maxlen=self.max_records)  # 最新的记录在最前面，超出上限时自动丢弃最旧的
         
-    def add_record(self, program_name: str, remind_type: str, timestamp: datetime):
+    def add_record(self, program_name: str, remind_type: str, timestamp: Optional[float] = None):
+        """添加提醒记录；timestamp 为 time.time() 时间戳，显示时再格式化"""
+        if timestamp is None:
+            timestamp = time.time()
         record = {
             'program': program_name,
             'type': remind_type,
             'timestamp': timestamp,
             'message': f"{program_name} - {remind_type} 提醒"
         }
-        self.history.insert(0, record)
-        if len(self.history) > self.max_records:
-            self.history = self.history[:self.max_records]
+        self.history.appendleft(record)
     
     def get_recent_records(self, count: int = 10):
-        return self.history[:count]
+        return list(islice(self.history, count))
 
 
 class BubbleTooltip(QWidget):
@@ -208,6 +816,7 @@ class BubbleTooltip(QWidget):
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self.hide)
         self.current_program = None
         
@@ -223,13 +832,7 @@ class BubbleTooltip(QWidget):
         
         # 创建半透明背景
         self.background_frame = QFrame()
-        self.background_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(50, 50, 50, 220);
-                border-radius: 8px;
-                border: 1px solid rgba(255, 255, 255, 150);
-            }
-        """)
+        self.background_frame.setStyleSheet(_STYLE_BUBBLE_BACKGROUND)
         
         # 内容布局
         content_layout = QVBoxLayout(self.background_frame)
@@ -238,50 +841,20 @@ class BubbleTooltip(QWidget):
         # 标题
         self.title_label = QLabel(tr("bubble.title"))
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #FFD700;
-                font-weight: bold;
-                font-size: 14px;
-            }
-        """)
+        self.title_label.setStyleSheet(_STYLE_BUBBLE_TITLE)
         
         # 消息
         self.message_label = QLabel()
         self.message_label.setAlignment(Qt.AlignCenter)
         self.message_label.setWordWrap(True)
-        self.message_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-        """)
+        self.message_label.setStyleSheet(_STYLE_BUBBLE_MESSAGE)
         
         # 按钮布局
         button_layout = QHBoxLayout()
         
         # 立即保存按钮
         self.auto_save_btn = QPushButton(tr("bubble.save_now"))
-        self.auto_save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 150, 0, 200);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 100);
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-                min-height: 35px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 180, 0, 200);
-                transform: scale(1.05);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 120, 0, 200);
-            }
-        """)
+        self.auto_save_btn.setStyleSheet(_STYLE_BUBBLE_SAVE_BUTTON)
         self.auto_save_btn.clicked.connect(self.on_auto_save_clicked)
         self.auto_save_btn.hide()  # 默认隐藏
         
@@ -339,11 +912,19 @@ class AutoSaveManager:
     def __init__(self, target_programs: List[str]):
         self.target_programs = target_programs
         self.focus_auto_save_enabled = False
-        self.keyboard_controller = None
-        self.pending_save_programs = set()  # 等待保存的程序列表
-        
-        if HAS_PYNPUT:
-            self.keyboard_controller = keyboard.Controller()
+        self.keyboard_controller = None  # 第一次需要模拟按键时创建（见 _ensure_controller）
+        self.pending_save_programs: Dict[str, Tuple[str, str]] = {}  # 等待保存的程序 {程序名: (小写名, 去掉.exe的小写名)}
+        self._focus_cache = (0, 0, "")  # 前台窗口缓存 (hwnd, pid, 进程名小写)
+    
+    def _ensure_controller(self) -> bool:
+        """创建键盘控制器，pynput 不可用时返回 False"""
+        if self.keyboard_controller is None and _ensure_pynput():
+            try:
+                self.keyboard_controller = keyboard.Controller()
+            except Exception as e:
+                print(f"[ERROR] 创建键盘控制器失败: {e}")
+                self.keyboard_controller = False
+        return bool(self.keyboard_controller)
     
     def enable_auto_save(self, enabled: bool):
         """启用/禁用聚焦时自动保存"""
@@ -354,21 +935,22 @@ class AutoSaveManager:
     def add_pending_save(self, program_name: str):
         """添加等待保存的程序"""
         if self.focus_auto_save_enabled:
-            self.pending_save_programs.add(program_name)
+            self.pending_save_programs[program_name] = self._normalize_name(program_name)
             print(f"[OK] {program_name} 已添加到等待保存列表")
     
     def check_and_save(self):
         """检查当前聚焦程序并执行自动保存"""
-        if not self.focus_auto_save_enabled or not self.keyboard_controller:
+        if not self.focus_auto_save_enabled or not self._ensure_controller():
             return
         
         try:
             # 检查当前聚焦的程序
             focused_program = self.get_focused_program()
             if focused_program:
-                # 检查是否有等待保存的程序匹配当前聚焦的程序
-                for pending_program in list(self.pending_save_programs):
-                    if self.is_program_match(focused_program, pending_program):
+                # 检查是否有等待保存的程序匹配当前聚焦的程序（等待列表已在加入时规范化）
+                focused = self._normalize_name(focused_program)
+                for pending_program, pending in list(self.pending_save_programs.items()):
+                    if self._names_match(focused, pending):
                         # 执行自动保存
                         self.keyboard_controller.press(Key.ctrl)
                         self.keyboard_controller.press('s')
@@ -376,33 +958,45 @@ class AutoSaveManager:
                         self.keyboard_controller.release(Key.ctrl)
                         
                         # 从等待列表中移除
-                        self.pending_save_programs.discard(pending_program)
+                        del self.pending_save_programs[pending_program]
                         print(f"[OK] 已为聚焦的 {focused_program} 执行自动保存（匹配 {pending_program}）")
                         return True
         except Exception as e:
             print(f"[ERROR] 聚焦时自动保存失败: {e}")
             return False
     
+    def _get_focused_process_name(self) -> Optional[str]:
+        """获取前台窗口所属进程名（小写），前台窗口未变化时直接使用缓存"""
+        if not HAS_WIN32GUI:
+            return None
+        
+        # 获取当前活动窗口
+        hwnd = win32gui.GetForegroundWindow()
+        if not hwnd:
+            return None
+        
+        cached_hwnd, cached_pid, cached_name = self._focus_cache
+        if hwnd == cached_hwnd and psutil.pid_exists(cached_pid):
+            return cached_name
+        
+        # 前台窗口已切换或原进程已退出，重新获取进程信息
+        self._focus_cache = (0, 0, "")
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        process = psutil.Process(pid)
+        with process.oneshot():
+            process_name = process.name().lower()
+        self._focus_cache = (hwnd, pid, process_name)
+        return process_name
+    
     def get_focused_program(self) -> Optional[str]:
         """获取当前聚焦的程序"""
         try:
-            if sys.platform == "win32":
-                import win32gui
-                import win32process
-                
-                # 获取当前活动窗口
-                hwnd = win32gui.GetForegroundWindow()
-                if hwnd:
-                    # 获取进程ID
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    # 获取进程信息
-                    process = psutil.Process(pid)
-                    process_name = process.name().lower()
-                    
-                    # 检查是否为目标程序
-                    for target in self.target_programs:
-                        if target in process_name or process_name in target:
-                            return process_name
+            process_name = self._get_focused_process_name()
+            if process_name:
+                # 检查是否为目标程序
+                for target in self.target_programs:
+                    if target in process_name or process_name in target:
+                        return process_name
         except Exception as e:
             print(f"检查聚焦程序失败: {e}")
         
@@ -411,51 +1005,45 @@ class AutoSaveManager:
     def is_currently_focused(self, program_name: str) -> bool:
         """检查当前是否聚焦在指定程序上"""
         try:
-            if sys.platform == "win32":
-                import win32gui
-                import win32process
-                
-                # 获取当前活动窗口
-                hwnd = win32gui.GetForegroundWindow()
-                if hwnd:
-                    # 获取进程ID
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    # 获取进程信息
-                    process = psutil.Process(pid)
-                    process_name = process.name().lower()
-                    
-                    # 检查是否匹配目标程序
-                    target_name = program_name.lower()
-                    return (target_name in process_name or 
-                            process_name in target_name or
-                            target_name.replace('.exe', '') == process_name.replace('.exe', ''))
+            process_name = self._get_focused_process_name()
+            if process_name:
+                # 检查是否匹配目标程序
+                target_name = program_name.lower()
+                return (target_name in process_name or 
+                        process_name in target_name or
+                        target_name.replace('.exe', '') == process_name.replace('.exe', ''))
         except Exception as e:
             print(f"检查聚焦状态失败: {e}")
         
         return False
     
+    @staticmethod
+    def _normalize_name(program_name: str) -> Tuple[str, str]:
+        """返回 (小写名, 去掉.exe扩展名的小写名)"""
+        lower = program_name.lower()
+        return lower, lower.replace('.exe', '')
+    
+    @staticmethod
+    def _names_match(focused: Tuple[str, str], target: Tuple[str, str]) -> bool:
+        """比较两个已规范化的程序名"""
+        focused_lower, focused_no_ext = focused
+        target_lower, target_no_ext = target
+        # 多种匹配方式
+        return (target_lower in focused_lower or 
+                focused_lower in target_lower or
+                target_no_ext == focused_no_ext)
+    
     def is_program_match(self, focused_program: str, target_program: str) -> bool:
         """检查聚焦的程序是否匹配目标程序"""
         try:
-            focused_lower = focused_program.lower()
-            target_lower = target_program.lower()
-            
-            # 移除.exe扩展名进行比较
-            focused_no_ext = focused_lower.replace('.exe', '')
-            target_no_ext = target_lower.replace('.exe', '')
-            
-            # 多种匹配方式
-            return (target_lower in focused_lower or 
-                    focused_lower in target_lower or
-                    target_no_ext == focused_no_ext or
-                    focused_no_ext == target_no_ext)
+            return self._names_match(self._normalize_name(focused_program), self._normalize_name(target_program))
         except Exception as e:
             print(f"程序匹配检查失败: {e}")
             return False
     
     def perform_auto_save(self, program_name: str):
         """执行一键保存（立即保存）"""
-        if not self.keyboard_controller:
+        if not self._ensure_controller():
             return False
         
         try:
@@ -495,10 +1083,7 @@ class AutoSaveManager:
     def switch_to_program(self, program_name: str) -> bool:
         """切换到目标程序"""
         try:
-            if sys.platform == "win32":
-                import win32gui
-                import win32process
-                
+            if HAS_WIN32GUI:
                 # 查找目标程序的窗口
                 target_hwnd = self.find_program_window(program_name)
                 if target_hwnd:
@@ -514,10 +1099,7 @@ class AutoSaveManager:
     def find_program_window(self, program_name: str):
         """查找目标程序的窗口"""
         try:
-            if sys.platform == "win32":
-                import win32gui
-                import win32process
-                
+            if HAS_WIN32GUI:
                 target_name = program_name.lower()
                 target_hwnd = None
                 
@@ -526,7 +1108,8 @@ class AutoSaveManager:
                         try:
                             _, pid = win32process.GetWindowThreadProcessId(hwnd)
                             proc = psutil.Process(pid)
-                            proc_name = proc.name().lower()
+                            with proc.oneshot():
+                                proc_name = proc.name().lower()
                             
                             # 检查进程名是否匹配
                             if target_name in proc_name or proc_name in target_name:
@@ -546,40 +1129,38 @@ class AutoSaveManager:
             return None
 
 
-class HourlyReminder(QThread):
-    """整点提醒线程"""
-    
-    remind_signal = pyqtSignal(str)  # 整点提醒信号
-    
-    def __init__(self):
-        super().__init__()
-        self.running = True
-        self.last_hour = -1
-        self._stop_event = threading.Event()
-    
-    def run(self):
-        while self.running and not self._stop_event.is_set():
-            try:
-                current_hour = datetime.now().hour
-                if current_hour != self.last_hour and current_hour > 0:  # 避免午夜提醒
-                    self.remind_signal.emit(f"整点提醒：{current_hour}:00")
-                    self.last_hour = current_hour
-            except Exception as e:
-                print(f"整点提醒错误: {e}")
-            
-            # 使用事件等待，可以更快响应停止信号
-            if self._stop_event.wait(60):  # 等待60秒或直到停止事件
-                break
-    
-    def stop(self):
-        self.running = False
-        self._stop_event.set()
-        if self.isRunning():
-            self.quit()
-            self.wait(3000)  # 最多等待3秒
+# 主定时器周期（毫秒），聚焦检查每个周期执行一次
+MASTER_TICK_MS = 2000
+
+# 按程序类型选择提醒消息：(消息键, 程序名关键词)，按顺序匹配
+_PROGRAM_CATEGORIES = [
+    ("code", re.compile(r"code|notepad\+\+|sublime|atom", re.IGNORECASE)),
+    ("design", re.compile(r"photoshop|illustrator|figma|sketch", re.IGNORECASE)),
+    ("document", re.compile(r"word|excel|powerpoint", re.IGNORECASE)),
+]
+
 
+@functools.lru_cache(maxsize=128)
+def _program_category(program_name: str) -> str:
+    """返回程序所属类型的消息键；只取决于程序名，与提醒配置无关，修改设置后缓存仍然有效"""
+    for key, pattern in _PROGRAM_CATEGORIES:
+        if pattern.search(program_name):
+            return key
+    return 'default'
 
 
+# 图标资源目录
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_icon(filename: str) -> Optional[QIcon]:
+    """加载 assets 中的图标，每个文件只检查和读取一次；文件不存在时返回 None"""
+    icon_path = _ASSETS_DIR / filename
+    if not icon_path.is_file():
+        return None
+    return QIcon(str(icon_path))
+
 
 class SaveGuardWidget(QWidget):
     """主浮窗控件"""
@@ -587,23 +1168,36 @@ class SaveGuardWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.target_programs = []  # 目标程序列表
-        self.monitor_thread = None
-        self.save_timers = {}  # 程序保存计时器
+        self.program_monitor = None
+        self.save_due: Dict[str, float] = {}  # 各程序下次保存提醒的时间 {程序名: time.monotonic()}
+        self._save_heap: List[tuple] = []  # 按提醒时间排序的小顶堆 [(时间, 程序名)]，过期条目在出堆时丢弃
+        self.program_cache: Dict[str, Tuple[int, str]] = {}  # 运行中程序的提醒设置 {程序名: (间隔秒数, 提醒消息)}
+        self._remind_sound = None  # 预加载的 pygame 提醒声音（加载失败时为 False）
+        self._about_box = None  # 关于对话框（第一次显示时创建）
+        self._about_update_btn = None
         self.remind_config = RemindConfig()  # 提醒配置
         self.remind_history = RemindHistory()  # 提醒历史
         self.auto_save_manager = None  # 自动保存管理器
-        self.hourly_reminder = None  # 整点提醒
         self.bubble_tooltip = None  # 气泡提示
         self.is_dragging = False
         self.drag_position = QPoint()
         self.settings = QSettings("SaveGuard", "SaveGuard")  # 配置存储
+        # 延迟写入磁盘：连续修改设置时只在最后一次修改后 500ms 同步一次
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setTimerType(Qt.CoarseTimer)
+        self._settings_flush_timer.setInterval(500)
+        self._settings_flush_timer.timeout.connect(self.flush_settings)
+        self._pending_save = False  # 是否有尚未执行的 save_settings
+        self._synced_flags = None  # 上次同步到各组件的 (聚焦自动保存, 整点提醒) 开关
         
         # 加载保存的配置
         self.load_settings()
         
         # 初始化自动保存和整点提醒
         self.init_auto_save()
-        self.init_hourly_reminder()
+        self.init_master_timer()
+        self.init_remind_timer()
         self.init_bubble_tooltip()
         
         # 连接语言切换信号
@@ -613,10 +1207,10 @@ class SaveGuardWidget(QWidget):
         self.init_ui()
         self.setup_tray_icon()
         
-        # 设置主窗口图标
-        icon_path = Path(__file__).parent.parent / "assets" / "icon.png"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        # 设置主窗口图标（与托盘图标共用同一个 QIcon）
+        icon = _load_icon("icon.png")
+        if icon is not None:
+            self.setWindowIcon(icon)
         
         # 检测已运行的程序（在UI初始化后）
         self.check_running_programs_on_startup()
@@ -625,21 +1219,87 @@ class SaveGuardWidget(QWidget):
         """初始化聚焦时自动保存管理器"""
         self.auto_save_manager = AutoSaveManager(self.target_programs)
         self.auto_save_manager.enable_auto_save(self.remind_config.focus_auto_save_enabled)
-        
-        # 创建定时器检查聚焦状态
-        self.focus_timer = QTimer()
-        self.focus_timer.timeout.connect(self.check_focus_and_save)
-        
-        # 只有在启用时才启动定时器
-        if self.remind_config.focus_auto_save_enabled:
-            self.focus_timer.start(2000)  # 每2秒检查一次
     
-    def init_hourly_reminder(self):
-        """初始化整点提醒"""
+    def init_master_timer(self):
+        """初始化主定时器：聚焦检查和整点提醒共用一个定时器"""
+        self._next_hour_at = 0.0
+        self._master_timer = QTimer(self)
+        # 使用粗粒度定时器，避免 Windows 上为精确定时器提高系统定时器分辨率
+        self._master_timer.setTimerType(Qt.CoarseTimer)
+        self._master_timer.timeout.connect(self._master_tick)
+        self.update_master_timer()
+    
+    def update_master_timer(self):
+        """根据设置启动或停止主定时器（两项功能都关闭时不再定时唤醒）"""
+        # 整点提醒开启时才计算下一个整点，关闭时清除
+        if not self.remind_config.hourly_remind_enabled:
+            self._next_hour_at = 0.0
+        elif not self._next_hour_at:
+            self._schedule_next_hour()
+        needed = self.remind_config.focus_auto_save_enabled or self.remind_config.hourly_remind_enabled
+        if needed and not self._master_timer.isActive():
+            self._master_timer.start(MASTER_TICK_MS)
+        elif not needed and self._master_timer.isActive():
+            self._master_timer.stop()
+    
+    def _master_tick(self):
+        """主定时器回调：每个周期检查聚焦状态和整点"""
+        if self.remind_config.focus_auto_save_enabled:
+            self.check_focus_and_save()
         if self.remind_config.hourly_remind_enabled:
-            self.hourly_reminder = HourlyReminder()
-            self.hourly_reminder.remind_signal.connect(self.on_hourly_remind)
-            self.hourly_reminder.start()
+            self.check_hourly_remind()
+    
+    def _schedule_next_hour(self):
+        """计算下一个整点的时间戳"""
+        now = time.time()
+        # 按本地时间对齐整点（时区偏移不一定是整小时）
+        offset = time.localtime(now).tm_gmtoff
+        self._next_hour_at = now + 3600 - (now + offset) % 3600
+    
+    def check_hourly_remind(self):
+        """检查是否到达新的整点（未到整点时只比较一次时间戳）"""
+        if time.time() < self._next_hour_at:
+            return
+        self._schedule_next_hour()
+        current_hour = time.localtime().tm_hour
+        if current_hour > 0:  # 避免午夜提醒
+            self.on_hourly_remind(f"整点提醒：{current_hour}:00")
+    
+    def init_remind_timer(self):
+        """初始化保存提醒定时器：所有程序共用一个单次定时器，每次定在最早到期的提醒"""
+        self._remind_timer = QTimer(self)
+        self._remind_timer.setSingleShot(True)
+        self._remind_timer.setTimerType(Qt.CoarseTimer)
+        self._remind_timer.timeout.connect(self._on_remind_timer)
+    
+    def schedule_remind(self, program_name: str):
+        """安排程序的下一次保存提醒"""
+        interval, _ = self.get_program_remind_info(program_name)
+        due = time.monotonic() + interval
+        self.save_due[program_name] = due
+        heapq.heappush(self._save_heap, (due, program_name))
+    
+    def _rearm_remind_timer(self):
+        """丢弃堆顶的过期条目，并将定时器定在最早的提醒时间"""
+        heap = self._save_heap
+        while heap and self.save_due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        if not heap:
+            self._remind_timer.stop()
+            return
+        self._remind_timer.start(max(0, int((heap[0][0] - time.monotonic()) * 1000)))
+    
+    def _on_remind_timer(self):
+        """提醒定时器回调：处理所有已到期的提醒，并重新安排下一次"""
+        now = time.monotonic()
+        heap = self._save_heap
+        while heap and heap[0][0] <= now:
+            due, program_name = heapq.heappop(heap)
+            if self.save_due.get(program_name) != due:
+                continue  # 程序已停止或已重新安排
+            self.schedule_remind(program_name)
+            self.remind_save(program_name)
+        self._rearm_remind_timer()
     
     def init_bubble_tooltip(self):
         """初始化气泡提示"""
@@ -659,13 +1319,7 @@ class SaveGuardWidget(QWidget):
         
         # 创建半透明背景
         self.background_frame = QFrame()
-        self.background_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(50, 50, 50, 200);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 100);
-            }
-        """)
+        self.background_frame.setStyleSheet(_STYLE_MAIN_BACKGROUND)
         
         # 内容布局
         content_layout = QVBoxLayout(self.background_frame)
@@ -674,33 +1328,21 @@ class SaveGuardWidget(QWidget):
         # 标题
         self.title_label = QLabel(tr("main_window.title"))
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-weight: bold;
-                font-size: 16px;
-            }
-        """)
+        self.title_label.setStyleSheet(_STYLE_MAIN_TITLE)
         
         # 状态标签
-        self.status_label = QLabel(tr("main_window.monitoring"))
+        self._monitoring_label = tr("main_window.monitoring")  # 翻译结果在语言切换时更新
+        self._waiting_label = tr("main_window.waiting")
+        self.status_label = QLabel(self._monitoring_label)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #90EE90;
-                font-size: 12px;
-            }
-        """)
+        self.status_label.setStyleSheet(_STYLE_STATUS)
+        self._status_style = _STYLE_STATUS
         
         # 监控程序数量
-        self.program_count_label = QLabel(tr("main_window.programs") + ": 0")
+        self._programs_label = tr("main_window.programs")  # 翻译结果在语言切换时更新
+        self.program_count_label = QLabel(self._programs_label + ": 0")
         self.program_count_label.setAlignment(Qt.AlignCenter)
-        self.program_count_label.setStyleSheet("""
-            QLabel {
-                color: #87CEEB;
-                font-size: 11px;
-            }
-        """)
+        self.program_count_label.setStyleSheet(_STYLE_PROGRAM_COUNT)
         
         content_layout.addWidget(self.title_label)
         content_layout.addWidget(self.status_label)
@@ -720,61 +1362,71 @@ class SaveGuardWidget(QWidget):
         self.tray_icon = QSystemTrayIcon(self)
         
         # 尝试加载自定义图标
-        icon_path = Path(__file__).parent.parent / "assets" / "icon.png"
-        if icon_path.exists():
-            self.tray_icon.setIcon(QIcon(str(icon_path)))
+        icon = _load_icon("icon.png")
+        if icon is not None:
+            self.tray_icon.setIcon(icon)
         else:
             # 回退到系统默认图标
             self.tray_icon.setIcon(self.style().standardIcon(QApplication.style().SP_ComputerIcon))
         
-        # 创建托盘菜单
-        tray_menu = QMenu()
-        
-        # 选择应用程序
-        select_apps_action = tray_menu.addAction(tr("menu.select_apps"))
-        select_apps_action.triggered.connect(self.select_applications)
+        # 托盘菜单和右键菜单只创建一次，共用同一组菜单项
+        self.init_menus()
         
-        # 程序管理
-        manage_programs_action = tray_menu.addAction(tr("menu.manage_programs"))
-        manage_programs_action.triggered.connect(self.manage_programs)
-        
-        # 设置
-        settings_action = tray_menu.addAction(tr("menu.settings"))
-        settings_action.triggered.connect(self.show_settings)
-        
-        # 提醒历史
-        history_action = tray_menu.addAction(tr("menu.history"))
-        history_action.triggered.connect(self.show_history)
+        self.tray_icon.setContextMenu(self._tray_menu)
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.show()
+    
+    def init_menus(self):
+        """创建菜单项以及共用这些菜单项的托盘菜单和右键菜单"""
+        # 菜单项 {翻译键: QAction}
+        self._menu_actions = {}
+        for key, slot in (
+            ("menu.select_apps", self.select_applications),
+            ("menu.manage_programs", self.manage_programs),
+            ("menu.settings", self.show_settings),
+            ("menu.history", self.show_history),
+            ("menu.auto_save", self.toggle_auto_save),
+            ("menu.hourly_remind", self.toggle_hourly_remind),
+            ("menu.check_update", self.check_for_updates),
+            ("menu.about", self.show_about),
+            ("menu.quit", self.quit_application),
+        ):
+            action = QAction(tr(key), self)
+            action.triggered.connect(slot)
+            self._menu_actions[key] = action
         
         # 聚焦时自动保存
-        self.auto_save_action = tray_menu.addAction(tr("menu.auto_save"))
+        self.auto_save_action = self._menu_actions["menu.auto_save"]
         self.auto_save_action.setCheckable(True)
         self.auto_save_action.setChecked(self.remind_config.focus_auto_save_enabled)
-        self.auto_save_action.triggered.connect(self.toggle_auto_save)
         
         # 整点提醒
-        self.hourly_remind_action = tray_menu.addAction(tr("menu.hourly_remind"))
+        self.hourly_remind_action = self._menu_actions["menu.hourly_remind"]
         self.hourly_remind_action.setCheckable(True)
         self.hourly_remind_action.setChecked(self.remind_config.hourly_remind_enabled)
-        self.hourly_remind_action.triggered.connect(self.toggle_hourly_remind)
-        
-        tray_menu.addSeparator()
-        
-        # 检查更新
-        check_update_action = tray_menu.addAction(tr("menu.check_update"))
-        check_update_action.triggered.connect(self.check_for_updates)
-        
-        # 关于
-        about_action = tray_menu.addAction(tr("menu.about"))
-        about_action.triggered.connect(self.show_about)
         
-        # 退出
-        quit_action = tray_menu.addAction(tr("menu.quit"))
-        quit_action.triggered.connect(self.quit_application)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.activated.connect(self.tray_icon_activated)
-        self.tray_icon.show()
+        actions = self._menu_actions
+        # 托盘菜单
+        self._tray_menu = QMenu(self)
+        self._tray_menu.addActions([actions["menu.select_apps"], actions["menu.manage_programs"],
+                                    actions["menu.settings"], actions["menu.history"],
+                                    self.auto_save_action, self.hourly_remind_action])
+        self._tray_menu.addSeparator()
+        self._tray_menu.addActions([actions["menu.check_update"], actions["menu.about"], actions["menu.quit"]])
+        
+        # 右键菜单
+        self._context_menu = QMenu(self)
+        self._context_menu.addActions([actions["menu.select_apps"], actions["menu.manage_programs"],
+                                       actions["menu.settings"], actions["menu.history"]])
+        self._context_menu.addSeparator()
+        self._context_menu.addActions([self.auto_save_action, self.hourly_remind_action])
+        self._context_menu.addSeparator()
+        self._context_menu.addActions([actions["menu.check_update"], actions["menu.about"], actions["menu.quit"]])
+    
+    def retranslate_menus(self):
+        """语言切换后更新菜单项文本"""
+        for key, action in self._menu_actions.items():
+            action.setText(tr(key))
         
     def mouse_press_event(self, event):
         """鼠标按下事件"""
@@ -796,47 +1448,7 @@ class SaveGuardWidget(QWidget):
         
     def context_menu_event(self, event):
         """右键菜单事件"""
-        menu = QMenu(self)
-        
-        select_apps_action = menu.addAction(tr("menu.select_apps"))
-        select_apps_action.triggered.connect(self.select_applications)
-        
-        manage_programs_action = menu.addAction(tr("menu.manage_programs"))
-        manage_programs_action.triggered.connect(self.manage_programs)
-        
-        settings_action = menu.addAction(tr("menu.settings"))
-        settings_action.triggered.connect(self.show_settings)
-        
-        history_action = menu.addAction(tr("menu.history"))
-        history_action.triggered.connect(self.show_history)
-        
-        menu.addSeparator()
-        
-        # 自动保存
-        auto_save_action = menu.addAction(tr("menu.auto_save"))
-        auto_save_action.setCheckable(True)
-        auto_save_action.setChecked(self.remind_config.focus_auto_save_enabled)
-        auto_save_action.triggered.connect(self.toggle_auto_save)
-        
-        # 整点提醒
-        hourly_remind_action = menu.addAction(tr("menu.hourly_remind"))
-        hourly_remind_action.setCheckable(True)
-        hourly_remind_action.setChecked(self.remind_config.hourly_remind_enabled)
-        hourly_remind_action.triggered.connect(self.toggle_hourly_remind)
-        
-        menu.addSeparator()
-        
-        # 检查更新
-        check_update_action = menu.addAction(tr("menu.check_update"))
-        check_update_action.triggered.connect(self.check_for_updates)
-        
-        about_action = menu.addAction(tr("menu.about"))
-        about_action.triggered.connect(self.show_about)
-        
-        quit_action = menu.addAction(tr("menu.quit"))
-        quit_action.triggered.connect(self.quit_application)
-        
-        menu.exec_(event.globalPos())
+        self._context_menu.exec_(event.globalPos())
         
     def tray_icon_activated(self, reason):
         """托盘图标点击事件"""
@@ -875,6 +1487,8 @@ class SaveGuardWidget(QWidget):
         dialog = AdvancedSettingsDialog(self.remind_config, self)
         if dialog.exec_() == QDialog.Accepted:
             self.remind_config = dialog.get_config()
+            # 提醒间隔和消息可能已修改，下次提醒时重新计算
+            self.program_cache.clear()
             self.save_settings()
     
     def show_history(self):
@@ -882,29 +1496,33 @@ class SaveGuardWidget(QWidget):
         dialog = HistoryDialog(self.remind_history, self)
         dialog.exec_()
             
-    def start_monitoring(self):
-        """开始监控"""
+    def start_monitoring(self, pid_cache: Optional[PidCache] = None):
+        """开始监控；监控器已在运行时只更换目标程序列表
+        
+        pid_cache 为刚完成的进程扫描结果，新建的监控器首次检查时复用。
+        """
+        if self.program_monitor and self.program_monitor.isRunning():
+            self.program_monitor.update_targets(self.target_programs)
+            return
+        
         if not self.target_programs:
             return
-            
-        if self.monitor_thread and self.monitor_thread.isRunning():
-            self.monitor_thread.stop()
-            self.monitor_thread.wait()
-            
-        self.monitor_thread = ProgramMonitorThread(self.target_programs)
-        self.monitor_thread.program_started.connect(self.on_program_started)
-        self.monitor_thread.program_stopped.connect(self.on_program_stopped)
-        self.monitor_thread.start()
+        
+        self.program_monitor = create_program_monitor(self.target_programs, self, pid_cache)
+        self.program_monitor.programs_delta.connect(self.on_programs_delta)
+        self.program_monitor.start()
+    
+    def on_programs_delta(self, started: list, stopped: list):
+        """处理一次监控周期内启动和停止的全部程序"""
+        for program_name, pid in started:
+            self.on_program_started(program_name, pid)
+        for program_name in stopped:
+            self.on_program_stopped(program_name)
         
     def on_program_started(self, program_name: str, pid: str):
         """程序启动处理"""
-        self.status_label.setText(f"{tr('main_window.monitoring')}: {program_name}")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #90EE90;
-                font-size: 10px;
-            }
-        """)
+        self.status_label.setText(f"{self._monitoring_label}: {program_name}")
+        self.set_status_style(_STYLE_STATUS_ACTIVE)
         
         # 更新程序计数显示
         self.update_program_count()
@@ -913,42 +1531,32 @@ class SaveGuardWidget(QWidget):
         if self.remind_config.welcome_message_enabled:
             self.show_welcome_message(program_name)
         
-        # 启动保存计时器
-        if program_name not in self.save_timers:
-            timer = QTimer()
-            timer.timeout.connect(lambda: self.remind_save(program_name))
-            
-            # 根据程序类型调整提醒间隔
-            interval = self.get_remind_interval_for_program(program_name)
-            timer.start(interval * 1000)  # 转换为毫秒
-            self.save_timers[program_name] = timer
+        # 安排保存提醒
+        if program_name not in self.save_due:
+            self.schedule_remind(program_name)
+            self._rearm_remind_timer()
             
     def on_program_stopped(self, program_name: str):
         """程序停止处理"""
-        # 停止保存计时器
-        if program_name in self.save_timers:
-            self.save_timers[program_name].stop()
-            del self.save_timers[program_name]
+        # 取消保存提醒（堆中的旧条目在出堆时丢弃）
+        self.program_cache.pop(program_name, None)
+        if self.save_due.pop(program_name, None) is not None:
+            self._rearm_remind_timer()
         
         # 更新程序计数显示
         self.update_program_count()
             
-        if not self.save_timers:
-            self.status_label.setText(tr("main_window.waiting"))
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #FFB6C1;
-                    font-size: 10px;
-                }
-            """)
+        if not self.save_due:
+            self.status_label.setText(self._waiting_label)
+            self.set_status_style(_STYLE_STATUS_WAITING)
             
     def remind_save(self, program_name: str):
         """提醒保存"""
         # 记录提醒历史
-        self.remind_history.add_record(program_name, "保存提醒", datetime.now())
+        self.remind_history.add_record(program_name, "保存提醒")
         
         # 获取提醒消息
-        message = self.get_remind_message_for_program(program_name)
+        _, message = self.get_program_remind_info(program_name)
         
         # 播放声音提醒
         if self.remind_config.sound_enabled:
@@ -959,11 +1567,11 @@ class SaveGuardWidget(QWidget):
             # 检查当前是否聚焦在目标程序
             if self.auto_save_manager.is_currently_focused(program_name):
                 # 如果当前聚焦在目标程序，立即执行自动保存
-                print(f"[OK] 当前聚焦在 {program_name}，立即执行自动保存")
+                logger.debug("[OK] 当前聚焦在 %s，立即执行自动保存", program_name)
                 self.auto_save_manager.perform_auto_save(program_name)
             else:
                 # 如果未聚焦在目标程序，添加到等待列表
-                print(f"[WARNING] 当前未聚焦在 {program_name}，等待聚焦时自动保存")
+                logger.debug("当前未聚焦在 %s，等待聚焦时自动保存", program_name)
                 self.auto_save_manager.add_pending_save(program_name)
         
         # 显示气泡提醒
@@ -987,73 +1595,54 @@ class SaveGuardWidget(QWidget):
     def check_running_programs_on_startup(self):
         """启动时检测已运行的程序"""
         if not self.target_programs:
-            print("[WARNING] 没有设置目标程序，跳过检测")
+            logger.warning("[WARNING] 没有设置目标程序，跳过检测")
             return
         
-        print("检测已运行的程序...")
-        print(f"目标程序: {self.target_programs}")
+        logger.debug("检测已运行的程序...")
+        logger.debug("目标程序: %s", self.target_programs)
         
-        # 使用与监控线程相同的逻辑检测程序
+        # 使用与监控线程相同的匹配器（精确匹配为一次字典查找，失败时才做子串匹配）
+        matcher = ProgramMatcher()
+        matcher._init_matcher(self.target_programs)
         found_programs = []
+        remaining = set(matcher.target_programs)  # 尚未发现的目标程序
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['name']:
-                        proc_name = proc_info['name'].lower()
-                        proc_name_no_ext = proc_name.replace('.exe', '')
-                        
-                        # 检查是否为目标程序
-                        for target in self.target_programs:
-                            target_lower = target.lower()
-                            target_no_ext = target_lower.replace('.exe', '')
-                            
-                            # 使用与监控线程相同的匹配逻辑
-                            if (target_lower == proc_name or 
-                                target_lower == proc_name_no_ext or
-                                target_no_ext == proc_name or
-                                target_no_ext == proc_name_no_ext or
-                                (target_lower in proc_name and len(target_lower) > 3) or
-                                (proc_name in target_lower and len(proc_name) > 3)):
-                                if target_lower not in found_programs:
-                                    found_programs.append(target_lower)
-                                    print(f"发现已运行程序: {target_lower} (PID: {proc_info['pid']})")
-                                break
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            # 只读取进程名（Linux/Windows 不经过 psutil 的通用进程对象）
+            for pid, name in _iter_process_names():
+                name = name.lower() if name else None
+                target = matcher._match_target(name) if name else None
+                # 记录每个进程的名称和匹配结果，交给监控器作为第一次扫描的结果
+                matcher._pid_cache[pid] = (name, target)
+                if target is not None and target not in found_programs:
+                    found_programs.append(target)
+                    logger.debug("发现已运行程序: %s (PID: %s)", target, pid)
+                    # 全部目标都已发现时停止扫描，未扫描的进程由监控器首次检查时补充
+                    remaining.discard(target)
+                    if not remaining:
+                        break
         except Exception as e:
-            print(f"检测运行程序时出错: {e}")
+            logger.warning("检测运行程序时出错: %s", e)
         
-        print(f"共发现 {len(found_programs)} 个已运行的程序")
+        logger.debug("共发现 %d 个已运行的程序", len(found_programs))
         
         if found_programs:
             # 更新UI状态
             self.status_label.setText(f"监控: {found_programs[0]}")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #90EE90;
-                    font-size: 10px;
-                }
-            """)
+            self.set_status_style(_STYLE_STATUS_ACTIVE)
             # 更新程序计数显示
             self.update_program_count()
             # 启动监控
-            self.start_monitoring()
+            self.start_monitoring(matcher._pid_cache)
             # 显示欢迎消息
             if self.remind_config.welcome_message_enabled:
                 self.show_startup_welcome_message(found_programs)
         else:
-            print("没有发现已运行的目标程序")
+            logger.debug("没有发现已运行的目标程序")
             # 更新UI状态为等待程序
             self.status_label.setText("等待程序...")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #FFB6C1;
-                    font-size: 10px;
-                }
-            """)
+            self.set_status_style(_STYLE_STATUS_WAITING)
             # 即使没有发现程序，也要启动监控线程以检测后续启动的程序
-            self.start_monitoring()
+            self.start_monitoring(matcher._pid_cache)
     
     
     def show_startup_welcome_message(self, programs):
@@ -1071,46 +1660,66 @@ class SaveGuardWidget(QWidget):
         if self.bubble_tooltip:
             self.bubble_tooltip.show_bubble(message, 4000)  # 显示4秒
     
+    def get_program_remind_info(self, program_name: str) -> Tuple[int, str]:
+        """获取程序的提醒间隔和提醒消息，程序运行期间只计算一次"""
+        info = self.program_cache.get(program_name)
+        if info is None:
+            # 根据程序类型调整提醒间隔和消息
+            info = (self.get_remind_interval_for_program(program_name),
+                    self.get_remind_message_for_program(program_name))
+            self.program_cache[program_name] = info
+        return info
+    
     def get_remind_interval_for_program(self, program_name: str) -> int:
         """获取提醒间隔（秒）"""
         return self.remind_config.interval_seconds
     
     def get_remind_message_for_program(self, program_name: str) -> str:
         """根据程序类型获取提醒消息"""
-        program_lower = program_name.lower()
-        
-        if any(editor in program_lower for editor in ['code', 'notepad++', 'sublime', 'atom']):
-            return self.remind_config.remind_messages.get('code', self.remind_config.remind_messages['default'])
-        elif any(tool in program_lower for tool in ['photoshop', 'illustrator', 'figma', 'sketch']):
-            return self.remind_config.remind_messages.get('design', self.remind_config.remind_messages['default'])
-        elif any(app in program_lower for app in ['word', 'excel', 'powerpoint']):
-            return self.remind_config.remind_messages.get('document', self.remind_config.remind_messages['default'])
-        else:
-            return self.remind_config.remind_messages['default']
+        messages = self.remind_config.remind_messages
+        return messages.get(_program_category(program_name), messages['default'])
+    
+    def _load_remind_sound(self) -> bool:
+        """第一次播放时加载提醒声音，之后每次提醒直接播放内存中的声音"""
+        if self._remind_sound is None:
+            try:
+                self._remind_sound = pygame.mixer.Sound("data/remind.wav")  # 需要提供声音文件
+            except Exception as e:
+                print(f"加载提醒声音失败: {e}")
+                self._remind_sound = False
+        return bool(self._remind_sound)
     
     def play_remind_sound(self):
         """播放提醒声音"""
         try:
             if sys.platform == "win32" and HAS_WINSOUND:
                 winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-            elif HAS_PYGAME:
-                # 使用pygame播放系统声音
-                pygame.mixer.music.load("data/remind.wav")  # 需要提供声音文件
-                pygame.mixer.music.play()
+            elif _ensure_pygame() and self._load_remind_sound():
+                # 使用pygame播放预加载的提醒声音
+                self._remind_sound.play()
             else:
                 # 使用Qt的系统声音
                 QApplication.beep()
         except Exception as e:
             print(f"播放声音失败: {e}")
         
+    def set_status_style(self, style: str):
+        """设置状态标签样式，样式未变化时不重新设置（避免 Qt 重新解析样式表）"""
+        if style is not self._status_style:
+            self._status_style = style
+            self.status_label.setStyleSheet(style)
+    
     def update_program_count(self):
         """更新程序数量显示"""
         # 计算当前运行的目标程序数量
         running_count = 0
-        if hasattr(self, 'monitor_thread') and self.monitor_thread:
-            running_count = len(self.monitor_thread.running_programs)
+        if hasattr(self, 'program_monitor') and self.program_monitor:
+            running_count = self.program_monitor.snapshot_count()
         
-        self.program_count_label.setText(f"{tr('main_window.programs')}: {running_count}/{len(self.target_programs)}")
+        text = f"{self._programs_label}: {running_count}/{len(self.target_programs)}"
+        # 数量未变化时不重新设置文本，避免标签重新布局
+        if text != self.program_count_label.text():
+            self.program_count_label.setText(text)
     
     def show_welcome_message(self, program_name: str):
         """显示程序打开欢迎消息"""
@@ -1124,7 +1733,7 @@ class SaveGuardWidget(QWidget):
         """整点提醒处理"""
         if self.remind_config.hourly_remind_enabled:
             # 记录提醒历史
-            self.remind_history.add_record("系统", "整点提醒", datetime.now())
+            self.remind_history.add_record("系统", "整点提醒")
             
             # 播放声音
             if self.remind_config.sound_enabled:
@@ -1142,12 +1751,8 @@ class SaveGuardWidget(QWidget):
         if self.auto_save_manager:
             self.auto_save_manager.enable_auto_save(self.remind_config.focus_auto_save_enabled)
         
-        # 控制聚焦检查定时器
-        if hasattr(self, 'focus_timer'):
-            if self.remind_config.focus_auto_save_enabled:
-                self.focus_timer.start(2000)  # 启动定时器
-            else:
-                self.focus_timer.stop()  # 停止定时器
+        # 控制主定时器
+        self.update_master_timer()
         
         self.save_settings()
         
@@ -1158,16 +1763,8 @@ class SaveGuardWidget(QWidget):
         self.remind_config.hourly_remind_enabled = not self.remind_config.hourly_remind_enabled
         self.hourly_remind_action.setChecked(self.remind_config.hourly_remind_enabled)
         
-        if self.remind_config.hourly_remind_enabled:
-            if not self.hourly_reminder:
-                self.hourly_reminder = HourlyReminder()
-                self.hourly_reminder.remind_signal.connect(self.on_hourly_remind)
-                self.hourly_reminder.start()
-        else:
-            if self.hourly_reminder and self.hourly_reminder.isRunning():
-                self.hourly_reminder.stop()
-                # 不等待，避免卡死
-                self.hourly_reminder = None
+        # 控制主定时器
+        self.update_master_timer()
         
         self.save_settings()
         
@@ -1186,45 +1783,46 @@ class SaveGuardWidget(QWidget):
             self.remind_config.from_dict(config_data)
     
     def save_settings(self):
-        """保存设置"""
+        """保存设置（延迟100ms执行，连续多次修改只保存和同步一次）"""
+        if not self._pending_save:
+            self._pending_save = True
+            QTimer.singleShot(100, Qt.CoarseTimer, self._do_save_settings)
+    
+    def _do_save_settings(self):
+        """写入设置并同步到各个组件"""
+        if not self._pending_save:
+            return
+        self._pending_save = False
+        
         # 保存程序列表
         self.settings.setValue("target_programs", self.target_programs)
         
         # 保存提醒配置
         self.settings.setValue("remind_config", self.remind_config.to_dict())
-        self.settings.sync()
+        self._settings_flush_timer.start()
         
         # 自动同步设置
         self.sync_settings()
     
+    def flush_settings(self):
+        """将待写入的设置同步到磁盘（Windows 上为注册表）"""
+        self._settings_flush_timer.stop()
+        self.settings.sync()
+    
     def sync_settings(self):
-        """同步设置到各个组件"""
+        """同步设置到各个组件（相关开关未变化时跳过）"""
+        flags = (self.remind_config.focus_auto_save_enabled, self.remind_config.hourly_remind_enabled)
+        if flags == self._synced_flags:
+            return
+        self._synced_flags = flags
         try:
             # 同步自动保存设置
             if hasattr(self, 'auto_save_manager') and self.auto_save_manager:
                 self.auto_save_manager.enable_auto_save(self.remind_config.focus_auto_save_enabled)
             
-            # 同步聚焦检查定时器
-            if hasattr(self, 'focus_timer'):
-                if self.remind_config.focus_auto_save_enabled:
-                    if not self.focus_timer.isActive():
-                        self.focus_timer.start(2000)  # 启动定时器
-                else:
-                    if self.focus_timer.isActive():
-                        self.focus_timer.stop()  # 停止定时器
-            
-            # 同步整点提醒
-            if self.remind_config.hourly_remind_enabled:
-                if not self.hourly_reminder or not self.hourly_reminder.isRunning():
-                    if self.hourly_reminder:
-                        self.hourly_reminder.stop()
-                    self.hourly_reminder = HourlyReminder()
-                    self.hourly_reminder.remind_signal.connect(self.on_hourly_remind)
-                    self.hourly_reminder.start()
-            else:
-                if self.hourly_reminder and self.hourly_reminder.isRunning():
-                    self.hourly_reminder.stop()
-                    self.hourly_reminder = None
+            # 同步聚焦检查和整点提醒的主定时器
+            if hasattr(self, '_master_timer'):
+                self.update_master_timer()
             
             # 同步托盘菜单状态
             if hasattr(self, 'auto_save_action'):
@@ -1269,7 +1867,18 @@ class SaveGuardWidget(QWidget):
             QMessageBox.warning(self, tr("update.check_failed"), message)
     
     def show_about(self):
-        """显示关于对话框"""
+        """显示关于对话框（第一次显示时创建，之后复用，避免每次重新解析富文本）"""
+        if self._about_box is None:
+            self._about_box, self._about_update_btn = self._create_about_box()
+        msg = self._about_box
+        msg.exec_()
+        
+        # 处理检查更新按钮点击
+        if msg.clickedButton() == self._about_update_btn:
+            self.check_for_updates()
+    
+    def _create_about_box(self):
+        """创建关于对话框，返回 (对话框, 检查更新按钮)"""
         about_text = f"""
         <div style="text-align: center;">
             <h2 style="color: #0078d4; margin-bottom: 10px;">SaveGuard v{VERSION}</h2>
@@ -1316,12 +1925,7 @@ class SaveGuardWidget(QWidget):
         # 添加检查更新按钮
         check_update_btn = msg.addButton("检查更新", QMessageBox.ActionRole)
         msg.addButton(QMessageBox.Ok)
-        
-        result = msg.exec_()
-        
-        # 处理检查更新按钮点击
-        if msg.clickedButton() == check_update_btn:
-            self.check_for_updates()
+        return msg, check_update_btn
     
     def on_language_changed(self, language_code: str):
         """语言切换处理"""
@@ -1329,18 +1933,15 @@ class SaveGuardWidget(QWidget):
         self.remind_config.language = language_code
         
         # 重新加载提醒消息
-        self.remind_config.remind_messages = {
-            "default": tr("messages.default"),
-            "code": tr("messages.code"),
-            "document": tr("messages.document"),
-            "design": tr("messages.design"),
-            "welcome": tr("messages.welcome"),
-            "hourly": tr("messages.hourly")
-        }
+        self.remind_config.remind_messages = RemindConfig.default_messages()
+        self.program_cache.clear()
         
         # 更新UI文本
         self.title_label.setText(tr("main_window.title"))
-        self.status_label.setText(tr("main_window.monitoring"))
+        self._monitoring_label = tr("main_window.monitoring")
+        self._waiting_label = tr("main_window.waiting")
+        self.status_label.setText(self._monitoring_label)
+        self._programs_label = tr("main_window.programs")
         self.update_program_count()
         
         # 更新气泡提示
@@ -1348,8 +1949,13 @@ class SaveGuardWidget(QWidget):
             self.bubble_tooltip.title_label.setText(tr("bubble.title"))
             self.bubble_tooltip.auto_save_btn.setText(tr("bubble.save_now"))
         
-        # 更新托盘菜单
-        self.setup_tray_icon()
+        # 更新托盘菜单和右键菜单
+        self.retranslate_menus()
+        
+        # 关于对话框下次显示时重新创建
+        if self._about_box is not None:
+            self._about_box.deleteLater()
+            self._about_box = self._about_update_btn = None
         
         # 保存设置
         self.save_settings()
@@ -1358,27 +1964,24 @@ class SaveGuardWidget(QWidget):
         """退出应用"""
         print(f"正在退出SaveGuard v{VERSION}...")
         
-        # 停止程序监控线程
-        if self.monitor_thread and self.monitor_thread.isRunning():
-            print("停止程序监控线程...")
-            self.monitor_thread.stop()
+        # 停止程序监控
+        if self.program_monitor and self.program_monitor.isRunning():
+            print("停止程序监控...")
+            self.program_monitor.stop()
             # 不等待，避免卡死
         
-        # 停止整点提醒线程
-        if self.hourly_reminder and self.hourly_reminder.isRunning():
-            print("停止整点提醒线程...")
-            self.hourly_reminder.stop()
-            # 不等待，避免卡死
+        # 停止聚焦检查和整点提醒的主定时器
+        if hasattr(self, '_master_timer') and self._master_timer:
+            print("停止主定时器...")
+            self._master_timer.stop()
         
-        # 停止聚焦检查定时器
-        if hasattr(self, 'focus_timer') and self.focus_timer:
-            print("停止聚焦检查定时器...")
-            self.focus_timer.stop()
+        # 停止保存提醒定时器
+        self._remind_timer.stop()
         
-        # 停止所有计时器
-        for timer in self.save_timers.values():
-            if timer.isActive():
-                timer.stop()
+        # 写入尚未保存和同步的设置
+        self._do_save_settings()
+        if self._settings_flush_timer.isActive():
+            self.flush_settings()
         
         print("退出完成")
         QApplication.quit()
@@ -1401,8 +2004,7 @@ class ProgramManagerDialog(QDialog):
         
         # 程序列表
         self.program_list = QListWidget()
-        for program in self.programs:
-            self.program_list.addItem(program)
+        self.program_list.addItems(self.programs)  # 一次插入全部程序，只发出一次行插入通知
         layout.addWidget(QLabel(tr("program_manager.program_list") + ":"))
         layout.addWidget(self.program_list)
         
@@ -1602,6 +2204,37 @@ class AdvancedSettingsDialog(QDialog):
         return self.config
 
 
+class HistoryModel(QAbstractListModel):
+    """提醒历史列表模型：只保存原始记录，显示文本在行第一次绘制时才格式化"""
+    
+    def __init__(self, records: List[Dict], parent=None):
+        super().__init__(parent)
+        self._records = records
+        self._texts: Dict[int, str] = {}  # 已格式化的显示文本 {行号: 文本}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._texts.get(row)
+        if text is None:
+            record = self._records[row]
+            # isoformat 与 strftime('%Y-%m-%d %H:%M:%S') 输出相同，但无需解析格式字符串
+            text = f"{datetime.fromtimestamp(record['timestamp']).isoformat(' ', 'seconds')} - {record['message']}"
+            self._texts[row] = text
+        return text
+    
+    def clear(self):
+        """清空全部记录"""
+        self.beginResetModel()
+        self._records = []
+        self._texts.clear()
+        self.endResetModel()
+
+
 class HistoryDialog(QDialog):
     """提醒历史对话框"""
     
@@ -1618,11 +2251,10 @@ class HistoryDialog(QDialog):
         layout = QVBoxLayout()
         
         # 历史列表
-        self.history_list = QListWidget()
-        records = self.history.get_recent_records(50)
-        for record in records:
-            item_text = f"{record['timestamp'].strftime('%Y-%m-%d %H:%M:%S')} - {record['message']}"
-            self.history_list.addItem(item_text)
+        self.history_list = QListView()
+        self.history_list.setUniformItemSizes(True)
+        self.history_model = HistoryModel(self.history.get_recent_records(50), self)
+        self.history_list.setModel(self.history_model)
         
         layout.addWidget(QLabel(tr("history.recent_records") + ":"))
         layout.addWidget(self.history_list)
@@ -1645,12 +2277,104 @@ class HistoryDialog(QDialog):
     
     def clear_history(self):
         self.history.history.clear()
-        self.history_list.clear()
+        self.history_model.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _dot_icon(color: str) -> QIcon:
+    """绘制一次圆点图标并缓存，代替列表项中的彩色 emoji（需在创建 QApplication 之后调用）"""
+    pixmap = QPixmap(12, 12)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QColor("#999999"))
+    painter.setBrush(QColor(color))
+    painter.drawEllipse(1, 1, 10, 10)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _scan_running_candidates(candidates: frozenset) -> Set[str]:
+    """扫描运行中的进程，返回其中的候选程序名（candidates 为小写集合），全部候选都已找到时提前结束扫描"""
+    running_processes = set()
+    try:
+        for _, name in _iter_process_names():
+            if not name:
+                continue
+            name = name.lower()
+            if name in candidates:
+                running_processes.add(name)
+                if len(running_processes) == len(candidates):
+                    break
+    except Exception as e:
+        logger.warning("扫描运行进程失败: %s", e)
+    return running_processes
+
+
+class AppListModel(QAbstractListModel):
+    """候选程序列表模型：运行状态只保存为一个集合，图标、文本和背景在行绘制时才计算"""
+    
+    # 背景画刷只创建一次，视图绘制时直接使用，无需每次由 QColor 转换
+    _RUNNING_BACKGROUND = QBrush(QColor(240, 248, 255))  # 浅蓝色背景
+    _NOT_RUNNING_BACKGROUND = QBrush(QColor(255, 255, 255))  # 白色背景
+    
+    def __init__(self, apps: Tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self._apps = apps
+        self._running: Optional[Set[str]] = None  # 正在运行的程序名集合，扫描完成前为 None
+        self._running_text = tr('app_selection.running')
+        self._not_running_text = tr('app_selection.not_running')
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._apps)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        app_name = self._apps[index.row()]
+        if role == Qt.UserRole:
+            return app_name
+        running = None if self._running is None else app_name in self._running
+        if role == Qt.DisplayRole:
+            if running is None:
+                return app_name
+            return f"{app_name} ({self._running_text if running else self._not_running_text})"
+        if role == Qt.DecorationRole:
+            if running is None:
+                return _dot_icon("#dddddd")
+            return _dot_icon("#28a745") if running else _dot_icon("#ffffff")  # 绿色 / 白色圆点
+        if role == Qt.BackgroundRole and running is not None:
+            return self._RUNNING_BACKGROUND if running else self._NOT_RUNNING_BACKGROUND
+        return None
+    
+    def set_running(self, running: Set[str]):
+        """更新运行状态；状态未变化时不通知视图，变化时只发出一次 dataChanged，视图只重新查询可见行"""
+        if running == self._running or not self._apps:
+            return
+        self._running = set(running)
+        self.dataChanged.emit(self.index(0), self.index(len(self._apps) - 1),
+                              [Qt.DisplayRole, Qt.DecorationRole, Qt.BackgroundRole])
 
 
 class AppSelectionDialog(QDialog):
     """应用程序选择对话框"""
     
+    # 后台扫描完成信号 (正在运行的候选程序名集合)，从线程池发出，排队到GUI线程处理
+    scanned = pyqtSignal(set)
+    
+    PROC_CACHE_SECONDS = 2.0  # 进程扫描结果的有效期
+    
+    # 预置应用程序列表（均为小写），所有对话框实例共用
+    COMMON_APPS = (
+        'notepad.exe', 'notepad++.exe', 'code.exe', 'sublime_text.exe',
+        'atom.exe', 'vim.exe', 'emacs.exe', 'chrome.exe', 'firefox.exe',
+        'edge.exe', 'photoshop.exe', 'illustrator.exe', 'figma.exe',
+        'sketch.exe', 'blender.exe', 'word.exe', 'excel.exe', 'powerpoint.exe',
+        'wps.exe', 'typora.exe', 'obsidian.exe', 'vscode.exe', 'idea64.exe',
+        'pycharm64.exe', 'webstorm64.exe', 'clion64.exe', 'rider64.exe'
+    )
+    COMMON_APPS_LOWER = frozenset(COMMON_APPS)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle(tr("app_selection.title"))
@@ -1658,51 +2382,35 @@ class AppSelectionDialog(QDialog):
         self.resize(600, 500)
         
         self.selected_apps = []
-        self.common_apps = [
-            'notepad.exe', 'notepad++.exe', 'code.exe', 'sublime_text.exe',
-            'atom.exe', 'vim.exe', 'emacs.exe', 'chrome.exe', 'firefox.exe',
-            'edge.exe', 'photoshop.exe', 'illustrator.exe', 'figma.exe',
-            'sketch.exe', 'blender.exe', 'word.exe', 'excel.exe', 'powerpoint.exe',
-            'wps.exe', 'typora.exe', 'obsidian.exe', 'vscode.exe', 'idea64.exe',
-            'pycharm64.exe', 'webstorm64.exe', 'clion64.exe', 'rider64.exe'
-        ]
+        self._scan_future = None
+        self.scanned.connect(self._on_processes_scanned)
+        self._proc_cache: Tuple[float, Set[str]] = (0.0, set())  # 最近一次进程扫描结果 (time.monotonic(), 进程名集合)
         self.init_ui()
-        self.load_running_apps_async()
+        self.load_running_apps()
     
     def init_ui(self):
         """初始化UI"""
         layout = QVBoxLayout()
+        # 一次解析整个对话框的样式表
+        self.setStyleSheet(_STYLE_APP_SELECTION)
         
         # 说明标签
         info_label = QLabel(tr("app_selection.select_apps") + ":")
-        info_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        info_label.setObjectName("infoLabel")
         layout.addWidget(info_label)
         
         # 加载进度标签
         self.loading_label = QLabel(tr("app_selection.loading"))
-        self.loading_label.setStyleSheet("font-size: 12px; color: #666; padding: 5px;")
+        self.loading_label.setObjectName("loadingLabel")
         self.loading_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.loading_label)
         
         # 应用程序列表
-        self.app_list = QListWidget()
-        self.app_list.setStyleSheet("""
-            QListWidget {
-                font-size: 12px;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-        """)
-        self.app_list.setSelectionMode(QListWidget.MultiSelection)
+        self.app_model = AppListModel(self.COMMON_APPS, self)
+        self.app_list = QListView()
+        self.app_list.setUniformItemSizes(True)
+        self.app_list.setModel(self.app_model)
+        self.app_list.setSelectionMode(QListView.MultiSelection)
         self.app_list.hide()  # 初始隐藏，加载完成后显示
         layout.addWidget(self.app_list)
         
@@ -1711,56 +2419,17 @@ class AppSelectionDialog(QDialog):
         
         # 刷新按钮
         refresh_btn = QPushButton(tr("app_selection.refresh"))
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
+        refresh_btn.setObjectName("refreshButton")
         refresh_btn.clicked.connect(self.refresh_apps)
         
         # 全选按钮
         select_all_btn = QPushButton(tr("app_selection.select_all"))
-        select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        select_all_btn.setObjectName("selectAllButton")
         select_all_btn.clicked.connect(self.select_all)
         
         # 清空选择按钮
         clear_btn = QPushButton(tr("app_selection.clear_selection"))
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
+        clear_btn.setObjectName("clearButton")
         clear_btn.clicked.connect(self.clear_selection)
         
         button_layout.addWidget(refresh_btn)
@@ -1778,84 +2447,74 @@ class AppSelectionDialog(QDialog):
         
         self.setLayout(layout)
     
-    def load_running_apps_async(self):
-        """异步加载正在运行的应用程序"""
-        # 使用QTimer延迟执行，避免阻塞UI
-        QTimer.singleShot(100, self.load_running_apps)
-    
     def load_running_apps(self):
-        """加载正在运行的应用程序"""
-        self.app_list.clear()
-        
-        try:
-            # 先添加常见应用程序（无论是否运行）
-            for app in self.common_apps:
-                item = QListWidgetItem(f"📱 {app}")
-                item.setData(Qt.UserRole, app)
-                self.app_list.addItem(item)
-            
-            # 异步检查哪些应用程序正在运行
-            QTimer.singleShot(50, self.check_running_apps)
-            
-        except Exception as e:
-            print(f"[ERROR] 加载应用程序列表失败: {e}")
-            self.loading_label.setText("加载失败，请重试")
+        """加载应用程序列表：候选程序由模型直接提供，运行状态在后台线程池中扫描"""
+        self.check_running_apps()
     
     def check_running_apps(self):
-        """检查哪些应用程序正在运行"""
+        """启动后台进程扫描，完成后由 _apply_running_state 更新列表"""
+        # 2秒内重复刷新时直接使用上次的扫描结果
+        timestamp, running_processes = self._proc_cache
+        if time.monotonic() - timestamp < self.PROC_CACHE_SECONDS:
+            self._apply_running_state(running_processes)
+            return
+        if self._scan_future is not None and not self._scan_future.done():
+            return  # 上一次扫描尚未完成，结果返回时会更新列表
+        # 在应用预先启动的线程池中扫描，打开对话框时无需创建线程
+        pool = getattr(QApplication.instance(), "scan_pool", None)
+        if pool is None:
+            self._on_processes_scanned(_scan_running_candidates(self.COMMON_APPS_LOWER))
+            return
+        self._scan_future = pool.submit(_scan_running_candidates, self.COMMON_APPS_LOWER)
+        self._scan_future.add_done_callback(self._emit_scanned)
+    
+    def _emit_scanned(self, future):
+        """在线程池中调用，通过信号把扫描结果交给GUI线程"""
+        try:
+            self.scanned.emit(future.result())
+        except RuntimeError:
+            pass  # 对话框已被销毁
+    
+    def _on_processes_scanned(self, running_processes: set):
+        """缓存扫描结果并更新列表"""
+        self._proc_cache = (time.monotonic(), running_processes)
+        self._apply_running_state(running_processes)
+    
+    def _apply_running_state(self, running_processes: set):
+        """根据扫描结果标记正在运行的应用程序（在GUI线程中执行）"""
         try:
-            # 获取当前运行的进程（只检查进程名）
-            running_processes = set()
-            for proc in psutil.process_iter(['name']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['name']:
-                        running_processes.add(proc_info['name'].lower())
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
             # 标记正在运行的应用程序
-            for i in range(self.app_list.count()):
-                item = self.app_list.item(i)
-                app_name = item.data(Qt.UserRole)
-                if app_name in running_processes:
-                    item.setText(f"🟢 {app_name} ({tr('app_selection.running')})")
-                    item.setBackground(QColor(240, 248, 255))  # 浅蓝色背景
-                else:
-                    item.setText(f"⚪ {app_name} ({tr('app_selection.not_running')})")
-                    item.setBackground(QColor(255, 255, 255))  # 白色背景
+            self.app_model.set_running(running_processes)
             
             # 隐藏加载提示，显示列表
             self.loading_label.hide()
             self.app_list.show()
             
-            print(f"[OK] 加载完成，找到 {len(running_processes)} 个运行中的进程")
+            logger.debug("加载完成，找到 %d 个运行中的程序", len(running_processes))
             
         except Exception as e:
-            print(f"[ERROR] 检查运行状态失败: {e}")
+            logger.warning("检查运行状态失败: %s", e)
             self.loading_label.setText("检查运行状态失败")
     
     def select_all(self):
         """全选"""
-        for i in range(self.app_list.count()):
-            self.app_list.item(i).setSelected(True)
+        self.app_list.selectAll()
     
     def clear_selection(self):
         """清空选择"""
         self.app_list.clearSelection()
     
     def refresh_apps(self):
-        """刷新应用程序列表"""
+        """刷新运行状态：候选列表不变，不重建也不隐藏列表，只重新扫描"""
         self.loading_label.setText(tr("app_selection.loading"))
         self.loading_label.show()
-        self.app_list.hide()
-        self.load_running_apps_async()
+        self.check_running_apps()
     
     def get_selected_apps(self):
         """获取选中的应用程序"""
         selected = []
-        for item in self.app_list.selectedItems():
-            app_name = item.data(Qt.UserRole)
+        for index in self.app_list.selectionModel().selectedIndexes():
+            app_name = index.data(Qt.UserRole)
             if app_name:
                 selected.append(app_name)
         return selected
@@ -1872,22 +2531,35 @@ class SaveGuardApp(QApplication):
         self.setApplicationName("SaveGuard")
         self.setApplicationVersion("1.0.0")
         
+        # 进程扫描线程池：提前启动工作线程，第一次打开应用选择对话框时无需等待线程创建
+        self.scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="process-scan")
+        self.scan_pool.submit(lambda: None)
+        
         # 创建主窗口
         self.main_widget = SaveGuardWidget()
         self.main_widget.show()
         
-        print(f"SaveGuard v{VERSION} 已启动")
-        print("右键点击浮窗或系统托盘图标来管理程序")
-        print(f"项目地址: {GITHUB_URL}")
+        logger.info("\n".join([
+            f"SaveGuard v{VERSION} 已启动",
+            "右键点击浮窗或系统托盘图标来管理程序",
+            f"项目地址: {GITHUB_URL}",
+        ]))
 
 
 def signal_handler(signum, frame):
-    """信号处理器"""
-    print(f"\n收到信号 {signum}，正在强制退出...")
-    sys.exit(0)
+    """信号处理器：在事件循环中正常退出，保存设置后让 app.exec_() 返回"""
+    print(f"\n收到信号 {signum}，正在退出...")
+    app = QApplication.instance()
+    if app is None:
+        sys.exit(0)
+    main_widget = getattr(app, "main_widget", None)
+    QTimer.singleShot(0, main_widget.quit_application if main_widget else app.quit)
 
 def main():
     """主函数"""
+    level = os.environ.get("SAVEGUARD_LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(level=getattr(logging, level, logging.INFO), format="%(message)s")
+    
     # 检查依赖
     if not HAS_PYNPUT:
         print("[WARNING] 警告: pynput未安装，自动保存功能将不可用")
@@ -1897,20 +2569,26 @@ def main():
         print("[WARNING] 警告: 声音模块未安装，声音提醒功能将不可用")
         print("请运行: pip install pygame")
     
-    # 设置信号处理
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    if psutil.version_info < (6, 0):
+        # psutil 6.0 之前 process_iter 会对每个缓存的进程检查PID是否被复用，进程较多时启动扫描明显变慢
+        print(f"[WARNING] 警告: psutil {psutil.__version__} 版本较旧，进程扫描较慢")
+        print("请运行: pip install psutil==6.0.0")
     
     try:
         app = SaveGuardApp(sys.argv)
         
+        # 设置信号处理（应用创建完成后再安装，启动期间不处理信号）
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        
         # 设置应用图标
-        icon_path = Path(__file__).parent.parent / "assets" / "icon.ico"
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
+        icon = _load_icon("icon.ico")
+        if icon is not None:
+            app.setWindowIcon(icon)
         
         # 运行应用
         result = app.exec_()
+        app.scan_pool.shutdown(wait=False)
         print("应用程序正常退出")
         return result
         